@@ -14,7 +14,7 @@ Note: This is a simple in-memory implementation. Carts will be lost on server
 restart. For production, consider using Redis or a database-backed solution.
 """
 
-from typing import Dict
+from typing import Dict, Union
 
 from .models import Cart, CartItem
 
@@ -65,11 +65,12 @@ def get_cart(session_id: str) -> Cart:
     return CART_STORE[session_id]
 
 
-def add_to_cart(session_id: str, item_data: dict) -> Cart:
+def add_to_cart(session_id: str, item_data: Union[dict, CartItem]) -> Cart:
     """
     Add an item to the cart for a given session.
     
     Creates a CartItem from the provided item_data dictionary and adds it to the cart.
+    An already-built CartItem is added as-is, without validating it again.
     If an item with the same retailer and product_id already exists, quantities are
     accumulated.
     
@@ -77,7 +78,7 @@ def add_to_cart(session_id: str, item_data: dict) -> Cart:
     
     Args:
         session_id: Unique identifier for the user session
-        item_data: Dictionary containing cart item data (must match CartItem fields):
+        item_data: CartItem, or dictionary containing cart item data (must match CartItem fields):
             - retailer: Retailer identifier
             - product_id: Product identifier
             - name: Product name
@@ -93,7 +94,7 @@ def add_to_cart(session_id: str, item_data: dict) -> Cart:
         ValidationError: If item_data doesn't match CartItem schema
     """
     cart = get_cart(session_id)
-    item = CartItem(**item_data)
+    item = item_data if isinstance(item_data, CartItem) else CartItem(**item_data)
     cart.add(item)
     
     # Persist to database if enabled
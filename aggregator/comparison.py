@@ -10,7 +10,7 @@ Key functions:
 - sort_products: Sorts products by various criteria with stable tie-breaking
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from aggregator.models import ProductPublic
 
 
@@ -32,8 +32,8 @@ def mark_cheapest(products: List[ProductPublic]) -> List[ProductPublic]:
         products: List of ProductPublic objects to analyze
         
     Returns:
-        List of ProductPublic objects with is_cheapest_total and is_cheapest_per_unit
-        flags updated. Input list is not mutated; new objects are created.
+        The same list, with is_cheapest_total, is_cheapest_per_unit and is_cheapest
+        updated in place on each product (no model copies are made).
         
     Examples:
         >>> from aggregator.models import ProductPublic
@@ -59,8 +59,7 @@ def mark_cheapest(products: List[ProductPublic]) -> List[ProductPublic]:
     valid_price_per_unit = [p.price_per_unit for p in products if p.price_per_unit is not None]
     min_price_per_unit = min(valid_price_per_unit) if valid_price_per_unit else None
     
-    # Create new ProductPublic objects with updated flags
-    result: List[ProductPublic] = []
+    # Stamp flags directly on the products (avoids a model_dump/re-validate per product)
     for product in products:
         # Determine is_cheapest_total
         is_cheapest_total = False
@@ -73,16 +72,62 @@ def mark_cheapest(products: List[ProductPublic]) -> List[ProductPublic]:
         if min_price_per_unit is not None and product.price_per_unit is not None:
             is_cheapest_per_unit = abs(product.price_per_unit - min_price_per_unit) < 0.001
         
-        # Create new product with updated flags
-        product_dict = product.model_dump()
-        product_dict["is_cheapest_total"] = is_cheapest_total
-        product_dict["is_cheapest_per_unit"] = is_cheapest_per_unit
+        product.is_cheapest_total = is_cheapest_total
+        product.is_cheapest_per_unit = is_cheapest_per_unit
         # Keep existing is_cheapest for backward compatibility (set to is_cheapest_total)
-        product_dict["is_cheapest"] = is_cheapest_total
-        
-        result.append(ProductPublic(**product_dict))
+        product.is_cheapest = is_cheapest_total
     
-    return result
+    return products
+
+
+# Map legacy/aliased sort values to canonical modes
+SORT_MODE_ALIASES = {
+    "price": "price_asc",
+    "price_low_high": "price_asc",
+    "price_high_low": "price_desc",
+    "price_per_unit": "price_per_unit_asc",
+    "retailer": "retailer",
+    "health": "health",
+}
+
+# Health priority for sorting (unknown tags sort as neutral)
+_HEALTH_PRIORITY = {
+    "healthy": 1,
+    "neutral": 2,
+    "unhealthy": 3,
+}
+
+
+# Sort key functions, one per canonical sort mode except "health" (see
+# _sort_by_health). Missing prices sort last
+# ascending (9999) and last descending (-1 before negation).
+def _price_asc_key(x: ProductPublic) -> Tuple[Any, ...]:
+    return (x.price if x.price is not None else 9999, x.name_key, x.retailer.lower())
+
+
+def _price_desc_key(x: ProductPublic) -> Tuple[Any, ...]:
+    return (-(x.price if x.price is not None else -1), x.name_key, x.retailer.lower())
+
+
+def _price_per_unit_asc_key(x: ProductPublic) -> Tuple[Any, ...]:
+    return (x.price_per_unit if x.price_per_unit is not None else 9999, x.name_key, x.retailer.lower())
+
+
+def _price_per_unit_desc_key(x: ProductPublic) -> Tuple[Any, ...]:
+    return (-(x.price_per_unit if x.price_per_unit is not None else -1), x.name_key, x.retailer.lower())
+
+
+def _retailer_key(x: ProductPublic) -> Tuple[Any, ...]:
+    return (x.retailer.lower(), x.name_key, x.price if x.price is not None else 9999)
+
+
+_SORT_KEY_FUNCTIONS = {
+    "price_asc": _price_asc_key,
+    "price_desc": _price_desc_key,
+    "price_per_unit_asc": _price_per_unit_asc_key,
+    "price_per_unit_desc": _price_per_unit_desc_key,
+    "retailer": _retailer_key,
+}
 
 
 def sort_products(products: List[ProductPublic], sort_by: Optional[str] = None) -> List[ProductPublic]:
@@ -125,74 +170,44 @@ def sort_products(products: List[ProductPublic], sort_by: Optional[str] = None)
         # Return a copy to avoid mutating input
         return list(products)
     
-    # Normalize sort_by (handle legacy values)
+    # Normalize sort_by (handle legacy values); unknown modes default to price_asc
     sort_by_lower = sort_by.lower()
+    canonical_sort = SORT_MODE_ALIASES.get(sort_by_lower, sort_by_lower)
+    if canonical_sort == "health":
+        return _sort_by_health(products)
+    key_fn = _SORT_KEY_FUNCTIONS.get(canonical_sort, _price_asc_key)
+    
+    # Decorate-sort-undecorate: compute each key tuple once, sort positions by key
+    # (stable, so equal keys keep input order), then map positions back to products
+    keys = [key_fn(p) for p in products]
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    return [products[i] for i in order]
+
+
+def _health_bucket_key(x: ProductPublic) -> Tuple[Any, ...]:
+    return (x.price if x.price is not None else 9999, x.name_key)
+
+
+def _sort_by_health(products: List[ProductPublic]) -> List[ProductPublic]:
+    """
+    Sort products by health tag, then price, then name.
     
-    # Map legacy/aliased sort values to canonical modes
-    sort_mode_map = {
-        "price": "price_asc",
-        "price_low_high": "price_asc",
-        "price_high_low": "price_desc",
-        "price_per_unit": "price_per_unit_asc",
-        "retailer": "retailer",
-        "health": "health",
-    }
-    
-    canonical_sort = sort_mode_map.get(sort_by_lower, sort_by_lower)
-    
-    # Health priority for sorting
-    health_priority = {
-        "healthy": 1,
-        "neutral": 2,
-        "unhealthy": 3,
-    }
-    
-    # Create a copy for sorting
-    sorted_products = list(products)
+    The health tag has only three priorities, so products are partitioned into one
+    bucket per priority and only the buckets are sorted by price, then name. Unknown
+    tags rank as neutral. Missing prices sort last within a bucket.
     
-    if canonical_sort == "price_asc":
-        sorted_products.sort(key=lambda x: (
-            x.price if x.price is not None else 9999,
-            (x.name or "").lower(),
-            x.retailer.lower()
-        ))
-    elif canonical_sort == "price_desc":
-        sorted_products.sort(key=lambda x: (
-            -(x.price if x.price is not None else -1),  # Negate for descending
-            (x.name or "").lower(),
-            x.retailer.lower()
-        ))
-    elif canonical_sort == "price_per_unit_asc":
-        sorted_products.sort(key=lambda x: (
-            x.price_per_unit if x.price_per_unit is not None else 9999,
-            (x.name or "").lower(),
-            x.retailer.lower()
-        ))
-    elif canonical_sort == "price_per_unit_desc":
-        sorted_products.sort(key=lambda x: (
-            -(x.price_per_unit if x.price_per_unit is not None else -1),
-            (x.name or "").lower(),
-            x.retailer.lower()
-        ))
-    elif canonical_sort == "retailer":
-        sorted_products.sort(key=lambda x: (
-            x.retailer.lower(),
-            (x.name or "").lower(),
-            x.price if x.price is not None else 9999
-        ))
-    elif canonical_sort == "health":
-        sorted_products.sort(key=lambda x: (
-            health_priority.get(x.health_tag, 2),
-            x.price if x.price is not None else 9999,
-            (x.name or "").lower()
-        ))
-    else:
-        # Unknown sort mode: default to price_asc
-        sorted_products.sort(key=lambda x: (
-            x.price if x.price is not None else 9999,
-            (x.name or "").lower(),
-            x.retailer.lower()
-        ))
+    Args:
+        products: List of ProductPublic objects to sort
+        
+    Returns:
+        New sorted list of ProductPublic objects
+    """
+    buckets: Dict[int, List[ProductPublic]] = {1: [], 2: [], 3: []}
+    for product in products:
+        buckets[_HEALTH_PRIORITY.get(product.health_tag, 2)].append(product)
     
-    return sorted_products
+    result: List[ProductPublic] = []
+    for priority in (1, 2, 3):
+        result.extend(sorted(buckets[priority], key=_health_bucket_key))
+    return result
 
@@ -268,7 +268,7 @@ class AHConnector(BaseConnector):
                 "Check your APIFY_TOKEN and ensure the actor is accessible."
             ) from e
 
-    def get_delivery_slots(self) -> Any:
+    def get_delivery_slots(self) -> List[Dict[str, Any]]:
         """
         Get delivery slots for Albert Heijn.
         
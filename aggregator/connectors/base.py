@@ -30,6 +30,10 @@ class BaseConnector(ABC):
     ensuring consistency across different retailer APIs. Each connector handles
     the specifics of its retailer's API while normalizing data into ProductInternal.
     
+    Instances are long-lived: aggregator.search.get_connector() creates one per retailer
+    and shares it across requests and worker threads, so any HTTP client a connector
+    holds is reused (keeping its connection pool warm) and must be safe for concurrent calls.
+    
     Attributes:
         retailer: String identifier for the retailer (e.g., "ah", "jumbo", "picnic")
     """
@@ -49,17 +53,21 @@ class BaseConnector(ABC):
             List of ProductInternal objects, each containing normalized product data
             with fields such as: id, retailer, name, price, quantity, quantity_unit, etc.
             All connectors must map their raw API responses into ProductInternal format.
+            
+            The returned list and dicts must be newly built for each call: the caller
+            owns them and normalizes them in place.
         """
         pass
 
     @abstractmethod
-    def get_delivery_slots(self) -> Any:
+    def get_delivery_slots(self) -> List[Dict[str, Any]]:
         """
         Retrieve available delivery slots for the retailer.
         
         Returns:
-            Delivery slots structure (connector-specific format).
-            Can be a list of slot dictionaries or any format supported by the retailer API.
-            Returns empty list if delivery slots are not supported or not available.
+            List of slot dictionaries (keys are connector-specific). Always a list:
+            implementations normalize whatever the retailer API returns, and return an
+            empty list if delivery slots are not supported or not available. Callers
+            (e.g. GET /delivery/slots) rely on this and do not re-check the type.
         """
         pass
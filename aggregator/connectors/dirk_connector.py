@@ -269,7 +269,7 @@ class DirkConnector(BaseConnector):
                 "Check your APIFY_TOKEN and ensure the actor is accessible."
             ) from e
 
-    def get_delivery_slots(self) -> Any:
+    def get_delivery_slots(self) -> List[Dict[str, Any]]:
         """
         Get delivery slots for Dirk.
         
@@ -242,7 +242,7 @@ class JumboConnector(BaseConnector):
                 "Check your APIFY_TOKEN and ensure the actor is accessible."
             ) from e
 
-    def get_delivery_slots(self) -> Any:
+    def get_delivery_slots(self) -> List[Dict[str, Any]]:
         """
         Get delivery slots for Jumbo.
         
@@ -17,6 +17,8 @@ import os
 from typing import Any, Dict, List, Optional
 
 from python_picnic_api import PicnicAPI
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 from aggregator.models import ProductInternal
 from aggregator.utils.units import parse_quantity_and_unit, canonicalize_unit, compute_price_per_unit
@@ -136,6 +138,11 @@ class PicnicConnector(BaseConnector):
                 password=password,
                 country_code=country_code,
             )
+            # The connector is shared across requests and threads (see BaseConnector), so give
+            # the underlying requests.Session a connection pool sized for concurrent searches
+            session = getattr(self.client, "session", None)
+            if isinstance(session, Session):
+                session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
             logger.debug("Picnic connector initialized successfully (country_code=%r)", country_code)
         except Exception as e:
             error_msg = str(e).lower()
@@ -334,7 +341,7 @@ class PicnicConnector(BaseConnector):
                 logger.error("Unexpected error searching Picnic products: %s", e, exc_info=True)
                 return []
 
-    def get_delivery_slots(self) -> Any:
+    def get_delivery_slots(self) -> List[Dict[str, Any]]:
         """
         Get delivery slots for Picnic.
         
@@ -342,15 +349,15 @@ class PicnicConnector(BaseConnector):
         on what python-picnic-api returns, typically a list of slot dictionaries.
         
         Returns:
-            Delivery slots structure from Picnic API (typically a list of slot dictionaries)
-            or empty list if no slots are available or an unexpected error occurs.
+            List of slot dictionaries from the Picnic API, or empty list if no slots are
+            available, the API returns a non-list structure, or an unexpected error occurs.
             
         Raises:
             PicnicAuthError: If authentication fails when fetching delivery slots
             RuntimeError: If credentials are not configured
         """
         try:
-            return self.client.get_delivery_slots()
+            slots = self.client.get_delivery_slots()
         except PicnicAuthError:
             # Re-raise auth errors so caller can handle them specially
             logger.warning("Picnic authentication failed when fetching delivery slots")
@@ -374,3 +381,9 @@ class PicnicConnector(BaseConnector):
             else:
                 logger.error("Unexpected error retrieving Picnic delivery slots: %s", e, exc_info=True)
                 return []
+        
+        # Normalize at the connector boundary: callers rely on always getting a list
+        if not isinstance(slots, list):
+            logger.warning("Unexpected Picnic delivery slots type %s, returning no slots", type(slots).__name__)
+            return []
+        return slots
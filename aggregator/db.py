@@ -552,16 +552,15 @@ def db_get_event_counts(
         from datetime import timedelta
         cutoff_time = datetime.utcnow() - timedelta(hours=since_hours)
         
-        # Query events since cutoff time
-        events = db.query(EventRow).filter(EventRow.ts >= cutoff_time).all()
-        
-        # Count by event_type
-        counts: Dict[str, int] = {}
-        for event in events:
-            event_type = event.event_type
-            counts[event_type] = counts.get(event_type, 0) + 1
-        
-        return counts
+        # Count by event_type in the database (served by idx_event_type_ts) instead of
+        # loading every event row since the cutoff into Python
+        rows = (
+            db.query(EventRow.event_type, func.count(EventRow.id))
+            .filter(EventRow.ts >= cutoff_time)
+            .group_by(EventRow.event_type)
+            .all()
+        )
+        return {event_type: count for event_type, count in rows}
     except Exception as e:
         logger.debug(f"Error getting event counts from database: {e}")
         return {}
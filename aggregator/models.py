@@ -17,6 +17,7 @@ Current field expectations:
 - Picnic connector returns: id, name, price_eur (from cents), unit_quantity, unit_size, image_url (constructed), url, raw
 """
 
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -143,6 +144,11 @@ class ProductPublic(BaseModel):
         if self.price_eur is None:
             # Use object.__setattr__ because Pydantic models are frozen by default
             object.__setattr__(self, "price_eur", self.price)
+    
+    @cached_property
+    def name_key(self) -> str:
+        """Lowercased, stripped name used for grouping and sort tie-breaks (computed once per product)."""
+        return (self.name or "").lower().strip()
 
 
 # Cart models (kept for backward compatibility)
@@ -226,3 +232,32 @@ class Cart(BaseModel):
             line_total = item.price_eur * item.quantity
             totals[retailer] = totals.get(retailer, 0.0) + line_total
         return totals
+    
+    def to_view_dict(self) -> Dict[str, Any]:
+        """
+        Build the API cart view (items with line totals, total price, totals by retailer).
+        
+        Computes everything in a single pass over the items, so callers do not need
+        to call total() and total_by_retailer() separately.
+        
+        Returns:
+            Dictionary matching api.schemas.CartView: items, total_price, total_by_retailer
+        """
+        items_out: List[Dict[str, Any]] = []
+        total = 0.0
+        totals: Dict[str, float] = {}
+        for item in self.items.values():
+            line_total = item.price_eur * item.quantity
+            items_out.append({
+                "retailer": item.retailer,
+                "product_id": item.product_id,
+                "name": item.name,
+                "price_eur": item.price_eur,
+                "quantity": item.quantity,
+                "image_url": item.image_url,
+                "health_tag": item.health_tag,
+                "line_total": line_total,
+            })
+            total += line_total
+            totals[item.retailer] = totals.get(item.retailer, 0.0) + line_total
+        return {"items": items_out, "total_price": total, "total_by_retailer": totals}
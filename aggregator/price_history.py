@@ -9,16 +9,21 @@ Note: Data resets when the backend restarts (ephemeral file system on Render).
 
 import json
 import logging
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List
+from typing import Deque, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Price history file (JSONL format)
 PRICE_HISTORY_FILE = Path("price_history.jsonl")
 
+# Points kept in memory per product (GET /price-history caps limit at 100)
+MAX_POINTS_PER_PRODUCT = 100
+
 
 @dataclass
 class PricePoint:
@@ -27,6 +32,72 @@ class PricePoint:
     price_eur: float  # Price in euros
 
 
+# In-memory index of the (append-only) history file: (retailer, product id without
+# retailer prefix) -> the last MAX_POINTS_PER_PRODUCT points in file order (the file is
+# written in timestamp order). Each read only parses lines appended since the previous
+# read, instead of re-parsing the whole file per request.
+_HISTORY_INDEX: Dict[Tuple[str, str], Deque[PricePoint]] = {}
+_HISTORY_INDEX_LOCK = threading.Lock()
+# (path, inode) the index was built from, and the byte offset parsed up to
+_index_source: Optional[Tuple[str, int]] = None
+_index_offset = 0
+
+
+def _clean_product_id(product_id: str) -> str:
+    """Strip a "retailer:" prefix from a product id."""
+    return product_id.split(":")[-1] if ":" in product_id else product_id
+
+
+def _refresh_index() -> None:
+    """
+    Bring _HISTORY_INDEX up to date with PRICE_HISTORY_FILE.
+    
+    Parses complete lines appended since the last refresh, one line at a time. The index is rebuilt from
+    scratch if the file was replaced or truncated (or PRICE_HISTORY_FILE changed), and
+    cleared if the file no longer exists. Caller must hold _HISTORY_INDEX_LOCK.
+    """
+    global _index_source, _index_offset
+    
+    try:
+        stat = PRICE_HISTORY_FILE.stat()
+    except FileNotFoundError:
+        _HISTORY_INDEX.clear()
+        _index_source, _index_offset = None, 0
+        return
+    
+    source = (str(PRICE_HISTORY_FILE), stat.st_ino)
+    if source != _index_source or stat.st_size < _index_offset:
+        _HISTORY_INDEX.clear()
+        _index_source, _index_offset = source, 0
+    if stat.st_size == _index_offset:
+        return
+    
+    with PRICE_HISTORY_FILE.open("rb") as f:
+        f.seek(_index_offset)
+        for line in f:
+            # A writer may be mid-line: leave an incomplete last line for the next refresh
+            if not line.endswith(b"\n"):
+                break
+            _index_offset += len(line)
+            
+            try:
+                rec = json.loads(line)
+                if not rec:
+                    continue
+                
+                ts = float(rec.get("ts", 0))
+                price = float(rec.get("price_eur", 0))
+                if ts > 0 and price > 0:
+                    key = (str(rec.get("retailer", "")), _clean_product_id(str(rec.get("product_id", ""))))
+                    points = _HISTORY_INDEX.get(key)
+                    if points is None:
+                        points = _HISTORY_INDEX[key] = deque(maxlen=MAX_POINTS_PER_PRODUCT)
+                    points.append(PricePoint(ts=ts, price_eur=price))
+            except (json.JSONDecodeError, ValueError, KeyError, TypeError, AttributeError):
+                # Skip malformed lines
+                continue
+
+
 def record_prices_for_products(products: List[dict]) -> None:
     """
     Record prices for a list of products to the price history file.
@@ -86,36 +157,13 @@ def get_price_history(product_id: str, retailer: str, limit: int = 30) -> List[P
     Returns:
         List of PricePoint objects, sorted by timestamp (oldest first)
     """
-    points: List[PricePoint] = []
-    
     try:
-        if not PRICE_HISTORY_FILE.exists():
-            return []
-        
         # Normalize product_id - handle both "retailer:id" and just "id" formats
-        product_id_clean = product_id.split(":")[-1] if ":" in product_id else product_id
+        key = (retailer, _clean_product_id(product_id))
         
-        with PRICE_HISTORY_FILE.open("r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    rec = json.loads(line.strip())
-                    if not rec:
-                        continue
-                    
-                    # Match by retailer and product_id (handle both formats)
-                    rec_product_id = str(rec.get("product_id", ""))
-                    rec_product_id_clean = rec_product_id.split(":")[-1] if ":" in rec_product_id else rec_product_id
-                    rec_retailer = str(rec.get("retailer", ""))
-                    
-                    if rec_product_id_clean == product_id_clean and rec_retailer == retailer:
-                        ts = float(rec.get("ts", 0))
-                        price = float(rec.get("price_eur", 0))
-                        
-                        if ts > 0 and price > 0:
-                            points.append(PricePoint(ts=ts, price_eur=price))
-                except (json.JSONDecodeError, ValueError, KeyError, TypeError):
-                    # Skip malformed lines
-                    continue
+        with _HISTORY_INDEX_LOCK:
+            _refresh_index()
+            points = list(_HISTORY_INDEX.get(key, ()))
         
         # Sort by timestamp (oldest first) and limit
         points.sort(key=lambda p: p.ts)
@@ -12,8 +12,9 @@ from the TTL cache.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,14 @@ MIN_PRICE_DIFFERENCE_PER_UNIT = 0.01  # 1 cent minimum
 # e.g., 0.10 = 10% - won't suggest healthier if price is more than 10% higher
 MAX_PRICE_INCREASE_FOR_HEALTHIER = 0.10
 
+# Retailers searched for alternatives
+SAVINGS_RETAILERS = ["ah", "jumbo", "picnic", "dirk"]
+
+# Upper bound on retailer fetch threads while prefetching one basket's searches.
+# Each search already fans out to one thread per retailer, so the number of searches
+# run concurrently is this budget divided by the number of retailers.
+MAX_PREFETCH_THREADS = 8
+
 # Health tag ordering for comparison (higher number = healthier)
 HEALTH_ORDER = {
     "unhealthy": 0,
@@ -112,9 +121,12 @@ def find_basket_savings(
     
     suggestions: List[Dict[str, Any]] = []
     
+    # Run this pass's searches concurrently up front, once per distinct product name
+    cheaper_search_fn = _prefetch_searches(basket_items, search_fn, "price_per_unit_asc")
+    
     for basket_item in basket_items:
         try:
-            suggestion = _find_cheaper_alternative(basket_item, search_fn)
+            suggestion = _find_cheaper_alternative(basket_item, cheaper_search_fn)
             if suggestion:
                 suggestions.append(suggestion)
         except Exception as e:
@@ -134,6 +146,14 @@ def find_basket_savings(
     )
     
     # Also look for healthier-only alternatives (when no cheaper option found)
+    suggested_product_ids = {s.get("current", {}).get("product_id") for s in suggestions}
+    healthier_candidates = [
+        item for item in basket_items
+        if str(item.get("product_id", "")) not in suggested_product_ids
+        and (item.get("health_tag") or "neutral") != "healthy"
+    ]
+    healthier_search_fn = _prefetch_searches(healthier_candidates, search_fn, "health")
+    
     for basket_item in basket_items:
         try:
             # Check if we already have a suggestion for this item (cheaper)
@@ -143,7 +163,7 @@ def find_basket_savings(
                 continue
             
             # Try to find a healthier alternative
-            healthier_suggestion = _find_healthier_alternative(basket_item, search_fn)
+            healthier_suggestion = _find_healthier_alternative(basket_item, healthier_search_fn)
             if healthier_suggestion:
                 suggestions.append(healthier_suggestion)
         except Exception as e:
@@ -197,6 +217,75 @@ def find_basket_savings(
     }
 
 
+def _prefetch_searches(
+    basket_items: List[Dict[str, Any]],
+    search_fn: Callable[..., Dict[str, Any]],
+    sort_by: str,
+) -> Callable[..., Dict[str, Any]]:
+    """
+    Run the alternative searches for basket items concurrently, once per distinct name.
+    
+    The per-item helpers search by product name one item at a time; running those
+    searches sequentially costs one retailer fan-out per item. This issues them all
+    up front on a thread pool (duplicate names share one search) and returns a
+    search function that answers the helpers from the prefetched results. The pool
+    is sized so that, with each search's retailer fan-out, at most
+    MAX_PREFETCH_THREADS retailer fetches run at once.
+    
+    Args:
+        basket_items: Basket items the pass will look up
+        search_fn: Search function (aggregated_search)
+        sort_by: Sort mode the pass searches with
+    
+    Returns:
+        Search function with the same signature as search_fn. Calls matching a
+        prefetched (query, sort_by) return that result (or re-raise its error);
+        any other call is passed through to search_fn.
+    """
+    # Same skip rule as the helpers: items without a name or a valid price are not searched
+    queries: List[str] = []
+    for item in basket_items:
+        try:
+            name = item.get("name", "").strip()
+            price_eur = float(item.get("price_eur", 0.0))
+        except (AttributeError, TypeError, ValueError):
+            # Malformed item: the per-item pass logs and skips it
+            continue
+        if name and price_eur > 0 and name not in queries:
+            queries.append(name)
+    
+    def run(query: str) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+        try:
+            return search_fn(
+                query=query,
+                retailers=SAVINGS_RETAILERS,  # Search all retailers
+                size_per_retailer=20,
+                page=0,
+                sort_by=sort_by,
+                health_filter=None,
+            ), None
+        except Exception as e:
+            return None, e
+    
+    max_workers = min(len(queries), max(1, MAX_PREFETCH_THREADS // len(SAVINGS_RETAILERS)))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = dict(zip(queries, executor.map(run, queries)))
+    else:
+        outcomes = {query: run(query) for query in queries}
+    
+    def prefetched_search_fn(**kwargs: Any) -> Dict[str, Any]:
+        outcome = outcomes.get(kwargs.get("query")) if kwargs.get("sort_by") == sort_by else None
+        if outcome is None:
+            return search_fn(**kwargs)
+        result, error = outcome
+        if error is not None:
+            raise error
+        return result
+    
+    return prefetched_search_fn
+
+
 def _find_cheaper_alternative(
     basket_item: Dict[str, Any],
     search_fn: Callable[[str, List[str], int, int, Optional[str], Optional[str]], Dict[str, Any]],
@@ -231,7 +320,7 @@ def _find_cheaper_alternative(
     try:
         search_results = search_fn(
             query=current_name,
-            retailers=["ah", "jumbo", "picnic", "dirk"],  # Search all retailers
+            retailers=SAVINGS_RETAILERS,  # Search all retailers
             size_per_retailer=20,
             page=0,
             sort_by="price_per_unit_asc",  # Prefer per-unit price comparison
@@ -249,16 +338,17 @@ def _find_cheaper_alternative(
         return None
     
     # Find cheaper alternatives
-    # Separate candidates by category match for better relevance
-    same_category_candidates = []
-    other_candidates = []
+    # Separate candidates by category match for better relevance. Candidates are kept
+    # as (product, price_eur, price_per_unit) so prices are parsed once per product.
+    same_category_candidates: List[Tuple[Dict[str, Any], float, Optional[float]]] = []
+    other_candidates: List[Tuple[Dict[str, Any], float, Optional[float]]] = []
+    current_product_id_clean = current_product_id.split(":")[-1] if ":" in current_product_id else current_product_id
     
     for product in products:
         # Skip if it's the same product
         product_id = str(product.get("id", ""))
         # Handle both "retailer:id" and just "id" formats
         product_id_clean = product_id.split(":")[-1] if ":" in product_id else product_id
-        current_product_id_clean = current_product_id.split(":")[-1] if ":" in current_product_id else current_product_id
         
         if product_id_clean == current_product_id_clean and product.get("retailer", "") == current_retailer:
             # Same product - skip
@@ -292,9 +382,9 @@ def _find_cheaper_alternative(
         
         # Categorize by similarity - prefer same-category candidates
         if _is_same_category_or_similar(basket_item, product):
-            same_category_candidates.append(product)
+            same_category_candidates.append((product, alt_price_eur, alt_price_per_unit))
         else:
-            other_candidates.append(product)
+            other_candidates.append((product, alt_price_eur, alt_price_per_unit))
     
     # Prefer same-category candidates, fallback to others if none found
     candidates_to_check = same_category_candidates if same_category_candidates else other_candidates
@@ -307,12 +397,7 @@ def _find_cheaper_alternative(
     best_alt_price_per_unit = None
     best_alt_price_eur = None
     
-    for product in candidates_to_check:
-        alt_price_eur = float(product.get("price_eur") or product.get("price", 0.0))
-        alt_price_per_unit = product.get("price_per_unit")
-        if alt_price_per_unit is not None:
-            alt_price_per_unit = float(alt_price_per_unit)
-        
+    for product, alt_price_eur, alt_price_per_unit in candidates_to_check:
         # Select best alternative (lowest per-unit price, then lowest total price)
         if best_alternative is None:
             best_alternative = product
@@ -467,7 +552,7 @@ def _find_healthier_alternative(
     try:
         search_results = search_fn(
             query=current_name,
-            retailers=["ah", "jumbo", "picnic", "dirk"],  # Search all retailers
+            retailers=SAVINGS_RETAILERS,  # Search all retailers
             size_per_retailer=20,
             page=0,
             sort_by="health",  # Get healthier options first
@@ -485,9 +570,10 @@ def _find_healthier_alternative(
         return None
     
     # Find healthier alternatives within price tolerance
-    # Separate candidates by category match
-    same_category_candidates = []
-    other_candidates = []
+    # Separate candidates by category match, as (product, health_tag, price_eur, price_per_unit)
+    same_category_candidates: List[Tuple[Dict[str, Any], str, float, Optional[float]]] = []
+    other_candidates: List[Tuple[Dict[str, Any], str, float, Optional[float]]] = []
+    current_product_id_clean = current_product_id.split(":")[-1] if ":" in current_product_id else current_product_id
     
     # Calculate maximum acceptable price (current + tolerance)
     max_price_eur = current_price_eur * (1 + MAX_PRICE_INCREASE_FOR_HEALTHIER)
@@ -499,7 +585,6 @@ def _find_healthier_alternative(
         # Skip if it's the same product
         product_id = str(product.get("id", ""))
         product_id_clean = product_id.split(":")[-1] if ":" in product_id else product_id
-        current_product_id_clean = current_product_id.split(":")[-1] if ":" in current_product_id else current_product_id
         
         if product_id_clean == current_product_id_clean and product.get("retailer", "") == current_retailer:
             # Same product - skip
@@ -535,9 +620,9 @@ def _find_healthier_alternative(
         
         # Categorize by similarity
         if _is_same_category_or_similar(basket_item, product):
-            same_category_candidates.append(product)
+            same_category_candidates.append((product, alt_health, alt_price_eur, alt_price_per_unit))
         else:
-            other_candidates.append(product)
+            other_candidates.append((product, alt_health, alt_price_eur, alt_price_per_unit))
     
     # Prefer same-category candidates, fallback to others if none found
     candidates_to_check = same_category_candidates if same_category_candidates else other_candidates
@@ -550,13 +635,7 @@ def _find_healthier_alternative(
     best_alt_price_eur = None
     best_alt_price_per_unit = None
     
-    for product in candidates_to_check:
-        alt_health = product.get("health_tag") or "neutral"
-        alt_price_eur = float(product.get("price_eur") or product.get("price", 0.0))
-        alt_price_per_unit = product.get("price_per_unit")
-        if alt_price_per_unit is not None:
-            alt_price_per_unit = float(alt_price_per_unit)
-        
+    for product, alt_health, alt_price_eur, alt_price_per_unit in candidates_to_check:
         if best_alternative is None:
             best_alternative = product
             best_alt_price_eur = alt_price_eur
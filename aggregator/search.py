@@ -2,13 +2,14 @@
 Aggregated search function that searches across multiple retailers.
 
 This module provides the core search aggregation functionality that:
-- Instantiates connectors for the selected retailers
+- Instantiates connectors for the selected retailers (reused across requests)
 - Performs parallel searches across retailers
 - Adds health tags to each product
 - Merges and sorts results based on the specified sort criteria
 - Filters by health tag if requested
 - Groups products by name and marks the cheapest in each group
 - Caches results with TTL to reduce redundant API calls
+- Coalesces concurrent identical searches into a single upstream fan-out
 
 The aggregated_search function is the main entry point for product searches
 in the aggregator system, unifying results from AH, Jumbo, and Picnic.
@@ -16,8 +17,14 @@ in the aggregator system, unifying results from AH, Jumbo, and Picnic.
 Search flow: Streamlit -> GET /search -> aggregated_search() -> connectors.search_products() -> ProductInternal -> ProductPublic -> dict
 """
 
+import asyncio
+import copy
 import logging
-from typing import List, Dict, Any, Optional
+import math
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Hashable, Iterator, Optional, Tuple
 
 from aggregator.models import ProductInternal, ProductPublic
 from aggregator.health import tag_health
@@ -25,6 +32,7 @@ from aggregator.comparison import mark_cheapest, sort_products
 from aggregator.utils.cache import (
     make_search_cache_key,
     get_cached_search,
+    redis_cache_active,
     set_cached_search,
 )
 
@@ -37,16 +45,109 @@ from .connectors.dirk_connector import DirkConnector
 logger = logging.getLogger(__name__)
 
 
-# Map retailer names to their connector classes
-# Using a function to get the classes dynamically so that patches in tests work correctly
-def _get_connector_map():
-    """Get the connector map, accessing classes dynamically for test compatibility."""
-    return {
-        "ah": AHConnector,
-        "jumbo": JumboConnector,
-        "picnic": PicnicConnector,
-        "dirk": DirkConnector,
-    }
+# Map retailer names to the names of their connector classes in this module.
+# Classes are looked up by name at call time so that tests patching
+# aggregator.search.AHConnector (etc.) still take effect.
+_CONNECTOR_CLASS_NAMES: Dict[str, str] = {
+    "ah": "AHConnector",
+    "jumbo": "JumboConnector",
+    "picnic": "PicnicConnector",
+    "dirk": "DirkConnector",
+}
+
+
+# Retailers with a connector; the single source of truth for retailer validation
+SUPPORTED_RETAILERS = frozenset(_CONNECTOR_CLASS_NAMES)
+
+
+def _get_connector_class(retailer: str) -> Any:
+    """Get the connector class for a retailer (resolved at call time for test compatibility)."""
+    return globals()[_CONNECTOR_CLASS_NAMES[retailer]]
+
+
+# Connector instances are reused across requests so that per-instance setup (API clients,
+# tokens, Picnic login) is paid once per process instead of once per search.
+# Keyed by (retailer, connector class) so a class patched in tests never receives an
+# instance that was cached for a different class.
+_CONNECTOR_CACHE: Dict[Tuple[str, Any], Any] = {}
+
+# Failed initializations are remembered for a short while so a broken connector (e.g. bad
+# credentials) is not re-initialized on every request: key -> (failed_at, exception)
+_CONNECTOR_INIT_FAILURES: Dict[Tuple[str, Any], Tuple[float, Exception]] = {}
+
+_CONNECTOR_CACHE_LOCK = threading.Lock()
+
+# Seconds before a failed connector initialization is retried
+CONNECTOR_INIT_RETRY_SECONDS = 60
+
+
+def get_connector(retailer: str) -> Any:
+    """
+    Return a shared connector instance for a retailer, creating it on first use.
+    
+    Errors raised by the connector's __init__ (PicnicAuthError, RuntimeError, ...)
+    propagate to the caller exactly as before. For CONNECTOR_INIT_RETRY_SECONDS
+    afterwards, a fresh copy of the error (same class and message, no traceback) is
+    raised instead of initializing again.
+    
+    Args:
+        retailer: Retailer identifier (must be in SUPPORTED_RETAILERS)
+        
+    Returns:
+        Connector instance for the retailer
+    """
+    connector_cls = _get_connector_class(retailer)
+    key = (retailer, connector_cls)
+    
+    with _CONNECTOR_CACHE_LOCK:
+        connector = _CONNECTOR_CACHE.get(key)
+        if connector is not None:
+            return connector
+        
+        failure = _CONNECTOR_INIT_FAILURES.get(key)
+        if failure is not None:
+            failed_at, init_error = failure
+            if time.time() - failed_at < CONNECTOR_INIT_RETRY_SECONDS:
+                # Raise a copy: re-raising the stored exception would keep appending
+                # frames to a traceback shared by every thread
+                raise copy.copy(init_error).with_traceback(None)
+            _CONNECTOR_INIT_FAILURES.pop(key, None)
+    
+    # Initialize outside the lock so a slow connector (e.g. Picnic login) does not
+    # block other retailers
+    try:
+        connector = connector_cls()
+    except Exception as init_error:
+        with _CONNECTOR_CACHE_LOCK:
+            _CONNECTOR_INIT_FAILURES[key] = (time.time(), init_error)
+        raise
+    
+    with _CONNECTOR_CACHE_LOCK:
+        # Another thread may have initialized the same connector concurrently; keep the first
+        return _CONNECTOR_CACHE.setdefault(key, connector)
+
+
+def reset_connector(retailer: Optional[str] = None) -> None:
+    """
+    Drop cached connector instances (and remembered init failures).
+    
+    Args:
+        retailer: Retailer to reset, or None to reset all connectors
+    """
+    with _CONNECTOR_CACHE_LOCK:
+        if retailer is None:
+            _CONNECTOR_CACHE.clear()
+            _CONNECTOR_INIT_FAILURES.clear()
+            return
+        for cache in (_CONNECTOR_CACHE, _CONNECTOR_INIT_FAILURES):
+            for key in [k for k in cache if k[0] == retailer]:
+                del cache[key]
+
+
+# Missing prices are carried through the pipeline as +inf (always the most expensive) and
+# only converted to the legacy 9999.0 sentinel when results are serialized
+MISSING_PRICE_SENTINEL = 9999.0
+
 
 # Health tag priority for sorting (higher number = sorted later)
 HEALTH_PRIORITY = {
@@ -72,7 +173,7 @@ def group_by_name_and_mark_cheapest(products: List[ProductPublic]) -> List[Produ
         products: List of ProductPublic objects
         
     Returns:
-        List of ProductPublic objects with is_cheapest field updated, preserving input order
+        The same list, with is_cheapest updated in place on each product (input order is preserved)
         
     Examples:
         >>> products = [
@@ -82,42 +183,310 @@ def group_by_name_and_mark_cheapest(products: List[ProductPublic]) -> List[Produ
         >>> result = group_by_name_and_mark_cheapest(products)
         >>> # Melk group: cheapest (1.99) should be marked True
     """
-    # Group products by normalized (lowercase) name while preserving insertion order
-    groups: Dict[str, List[ProductPublic]] = {}
-    group_order: List[str] = []  # Track order of groups as they appear
-    
-    for product in products:
-        normalized_name = (product.name or "").lower().strip()
-        if normalized_name not in groups:
-            groups[normalized_name] = []
-            group_order.append(normalized_name)
-        groups[normalized_name].append(product)
-    
-    # Process each group in original order and mark cheapest
-    result: List[ProductPublic] = []
-    for normalized_name in group_order:
-        group = groups[normalized_name]
+    # Single pass: track the running minimum (price, index) per normalized (lowercase) name.
+    # Missing prices are treated as infinitely expensive (a price of 0.0 is a real price);
+    # on ties the first product seen in the group wins.
+    best: Dict[str, Tuple[float, int]] = {}
+    for index, product in enumerate(products):
+        product.is_cheapest = False
+        price = math.inf if product.price is None else product.price
+        name_key = product.name_key
+        current = best.get(name_key)
+        if current is None or price < current[0]:
+            best[name_key] = (price, index)
+    
+    for _, index in best.values():
+        products[index].is_cheapest = True
+    
+    return products
+
+
+def _classify_runtime_error(retailer: str, error: RuntimeError, stage: str) -> str:
+    """
+    Map a connector RuntimeError to a connector status string.
+    
+    Missing Picnic credentials mean the connector is "disabled"; anything else is an "error".
+    """
+    error_msg = str(error).lower()
+    if retailer == "picnic" and ("credential" in error_msg or "not configured" in error_msg):
+        logger.warning("Picnic disabled%s: %s", " during search" if stage == "search" else "", error)
+        return "disabled"
+    if stage == "search":
+        logger.error("RuntimeError during %s search: %s", retailer, error)
+    else:
+        logger.error("Failed to initialize %s connector: %s", retailer, error)
+    return "error"
+
+
+def _fetch_retailer_items(
+    retailer: str,
+    query: str,
+    size_per_retailer: int,
+    page: int,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Fetch raw product dicts from one retailer, isolating connector failures.
+    
+    Runs on a worker thread of aggregated_search's executor, or inline when only
+    one retailer is searched.
+    
+    Args:
+        retailer: Retailer identifier
+        query: Search query string
+        size_per_retailer: Number of results to fetch
+        page: Page number (0-indexed)
         
-        # Find the cheapest product in the group
-        # Handle missing prices by treating them as very expensive (9999)
-        cheapest_index = 0
-        cheapest_price = group[0].price or 9999
+    Returns:
+        Tuple of (status, items) where status is "ok", "auth_error", "disabled" or "error"
+        and items is the (possibly empty) list of product dicts from the connector
+    """
+    # Get (or lazily instantiate) the shared connector for this retailer
+    logger.debug("Getting connector for retailer: %s", retailer)
+    try:
+        connector = get_connector(retailer)
+    except PicnicAuthError as init_error:
+        # Picnic authentication failed during initialization
+        logger.warning("Picnic authentication failed; skipping Picnic: %s", str(init_error))
+        return "auth_error", []
+    except RuntimeError as init_error:
+        # Connector initialization failed (e.g., missing API token)
+        return _classify_runtime_error(retailer, init_error, "init"), []
+    except Exception as init_error:
+        logger.error("Unexpected error initializing %s connector: %s", retailer, init_error, exc_info=True)
+        return "error", []
+    
+    # Search products for this retailer (returns List[Dict[str, Any]])
+    logger.debug("Calling connector.search_products for %s with query=%r size=%d page=%d", 
+                retailer, query, size_per_retailer, page)
+    try:
+        items = connector.search_products(query, size=size_per_retailer, page=page)
+    except PicnicAuthError as search_error:
+        # Picnic auth error during search - drop the cached connector so the
+        # next request logs in again
+        logger.warning("Picnic authentication failed; skipping Picnic results: %s", str(search_error))
+        reset_connector(retailer)
+        return "auth_error", []
+    except RuntimeError as search_error:
+        # Config error during search
+        return _classify_runtime_error(retailer, search_error, "search"), []
+    except Exception as search_error:
+        # Other errors during search
+        logger.error("Unexpected error during %s search: %s", retailer, search_error, exc_info=True)
+        return "error", []
+    
+    logger.info("Connector %s returned %d raw products", retailer, len(items) if items else 0)
+    return "ok", items or []
+
+
+def _to_internal_products(retailer: str, items: List[Dict[str, Any]]) -> List[ProductInternal]:
+    """
+    Normalize a retailer's product dicts and convert them to ProductInternal.
+    
+    Items that fail validation are logged and skipped.
+    
+    Args:
+        retailer: Retailer identifier the items came from
+        items: Product dicts returned by the connector
         
-        for i, product in enumerate(group[1:], start=1):
-            price = product.price or 9999
-            if price < cheapest_price:
-                cheapest_price = price
-                cheapest_index = i
+    Returns:
+        List of ProductInternal objects
+    """
+    internal_products: List[ProductInternal] = []
+    for item in items:
+        try:
+            # Connectors return freshly built dicts owned by the caller (see
+            # BaseConnector.search_products), so normalize them in place rather than copying
+            # Track if price was originally missing (for sorting/final output)
+            price_was_missing = "price" not in item and "price_eur" not in item
+            
+            # Normalize ID format: "{retailer}:{id}"
+            if ":" not in str(item.get("id", "")):
+                item["id"] = f"{retailer}:{item.get('id', '')}"
+            # Ensure price is set (use price_eur if price not present, +inf for missing)
+            if "price" not in item:
+                item["price"] = item.get("price_eur", math.inf if price_was_missing else 0.0)
+            # Ensure price_eur is set for backward compatibility
+            if "price_eur" not in item:
+                item["price_eur"] = item.get("price", math.inf if price_was_missing else 0.0)
+            # Map url to product_url if needed
+            if "product_url" not in item and "url" in item:
+                item["product_url"] = item["url"]
+            # Map raw to source_raw for ProductInternal
+            if "raw" in item and "source_raw" not in item:
+                item["source_raw"] = item["raw"]
+            # Store original price state for final output
+            item["_price_was_missing"] = price_was_missing
+            
+            # Convert to ProductInternal - this may raise ValidationError if required fields are missing
+            internal_product = ProductInternal(**item)
+            internal_products.append(internal_product)
+        except Exception as e:
+            # Log validation/conversion errors but continue processing other items
+            logger.error("Failed to convert product dict to ProductInternal for retailer %s: %s. Item: %s", 
+                        retailer, e, str(item)[:200], exc_info=True)
+            continue
+    
+    return internal_products
+
+
+def _to_public_products(internal_products: List[ProductInternal]) -> Tuple[List[ProductPublic], int]:
+    """
+    Health-tag ProductInternal objects and convert them to ProductPublic.
+    
+    Args:
+        internal_products: Validated internal products
         
-        # Mark cheapest and add all products to result
-        for i, product in enumerate(group):
-            # Create new ProductPublic with updated is_cheapest
-            product_dict = product.model_dump()
-            product_dict["is_cheapest"] = (i == cheapest_index)  # Update is_cheapest
-            updated_product = ProductPublic(**product_dict)
-            result.append(updated_product)
+    Returns:
+        Tuple of (public products, number of products that failed conversion)
+    """
+    public_products: List[ProductPublic] = []
+    conversion_errors = 0
+    for internal_product in internal_products:
+        try:
+            # Tag health using the internal product's dict representation
+            product_dict = internal_product.model_dump()
+            # Ensure price_eur is in the dict for tag_health compatibility
+            if "price_eur" not in product_dict:
+                product_dict["price_eur"] = product_dict.get("price", 0.0)
+            health_tag = tag_health(product_dict)
+            
+            # Convert to ProductPublic (as dict first to add price_eur, then create model)
+            product_dict = {
+                "id": internal_product.id,
+                "retailer": internal_product.retailer,
+                "name": internal_product.name,
+                "brand": internal_product.brand,
+                "category": internal_product.category,
+                "image_url": internal_product.image_url,
+                "url": internal_product.product_url,  # Map product_url to url
+                "price": internal_product.price,
+                "price_eur": internal_product.price,  # Set price_eur for backward compatibility
+                "currency": internal_product.currency,
+                "price_per_unit": internal_product.price_per_unit,
+                "unit": internal_product.unit or internal_product.unit_size,  # Legacy unit field
+                "unit_size": internal_product.unit_size,  # Legacy field
+                "quantity": internal_product.quantity,
+                "quantity_unit": internal_product.quantity_unit,
+                "is_promotion": internal_product.is_promotion,
+                "promo_text": internal_product.promo_text,
+                "health_tag": health_tag,
+                "is_cheapest": None,  # Will be set by group_by_name_and_mark_cheapest
+                "is_cheapest_total": False,  # Will be set by mark_cheapest
+                "is_cheapest_per_unit": False,  # Will be set by mark_cheapest
+                "raw": internal_product.source_raw,
+            }
+            # Every value comes from an already-validated ProductInternal (or is computed
+            # here), so skip re-validation and construct the public model directly
+            public_product = ProductPublic.model_construct(**product_dict)
+            public_products.append(public_product)
+        except Exception as e:
+            # Log conversion errors but continue
+            logger.error("Failed to convert ProductInternal to ProductPublic: %s. Product ID: %s", 
+                        e, internal_product.id if hasattr(internal_product, 'id') else 'unknown', exc_info=True)
+            conversion_errors += 1
+            continue
     
-    return result
+    return public_products, conversion_errors
+
+
+def _search_one(
+    retailer: str,
+    query: str,
+    size_per_retailer: int,
+    page: int,
+) -> Tuple[str, int, int, List[ProductPublic], int]:
+    """
+    Search one retailer and convert its results to health-tagged ProductPublic objects.
+    
+    Runs on a worker thread of aggregated_search's executor, or inline when only
+    one retailer is searched.
+    
+    Returns:
+        Tuple of (status, raw item count, ProductInternal count, public products,
+        number of products that failed ProductPublic conversion)
+    """
+    status, items = _fetch_retailer_items(retailer, query, size_per_retailer, page)
+    if not items:
+        logger.debug("No products returned from %s connector for query=%r", retailer, query)
+        return status, 0, 0, [], 0
+    
+    internal_products = _to_internal_products(retailer, items)
+    logger.info("Connector %s: raw_count=%d mapped_to_ProductInternal=%d", 
+               retailer, len(items), len(internal_products))
+    
+    public_products, conversion_errors = _to_public_products(internal_products)
+    return status, len(items), len(internal_products), public_products, conversion_errors
+
+
+def _iter_search_outcomes(
+    retailers: List[str],
+    query: str,
+    size_per_retailer: int,
+    page: int,
+) -> Iterator[Tuple[str, Tuple[str, int, int, List[ProductPublic], int]]]:
+    """
+    Run _search_one for each retailer and yield (retailer, outcome) as searches complete.
+    
+    A single retailer (the common autocomplete case) is searched inline on the calling
+    thread; otherwise retailers are searched concurrently on a worker pool. Unexpected
+    errors are logged and reported as an "error" outcome with no products.
+    """
+    if len(retailers) == 1:
+        retailer = retailers[0]
+        try:
+            outcome = _search_one(retailer, query, size_per_retailer, page)
+        except Exception as e:
+            logger.error("Unexpected error searching %s: %s", retailer, e, exc_info=True)
+            outcome = ("error", 0, 0, [], 0)
+        yield retailer, outcome
+        return
+    
+    # Search all retailers concurrently: connector calls are I/O-bound, so wall time drops
+    # to roughly the slowest retailer instead of the sum of all of them. Each worker also
+    # converts and health-tags its own batch, so that work overlaps with other fetches.
+    with ThreadPoolExecutor(max_workers=len(retailers)) as executor:
+        futures = {
+            executor.submit(_search_one, retailer, query, size_per_retailer, page): retailer
+            for retailer in retailers
+        }
+        for future in as_completed(futures):
+            retailer = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                # Log any other unexpected errors with full traceback
+                logger.error("Unexpected error searching %s: %s", retailer, e, exc_info=True)
+                outcome = ("error", 0, 0, [], 0)
+            yield retailer, outcome
+
+
+def _products_to_dicts(public_products: List[ProductPublic]) -> List[Dict[str, Any]]:
+    """
+    Serialize ProductPublic objects to the JSON-ready dicts returned by the search API.
+    
+    Both price and price_eur are always present for backward compatibility, and missing
+    prices (+inf internally) are exposed as the legacy 9999 sentinel. Products that fail
+    to serialize are logged and skipped.
+    """
+    results = []
+    for p in public_products:
+        try:
+            product_dict = p.model_dump(mode="json", by_alias=True)
+            # Ensure price_eur is present (backward compatibility)
+            if "price_eur" not in product_dict:
+                product_dict["price_eur"] = product_dict.get("price", 0.0)
+            # Also ensure price is present
+            if "price" not in product_dict:
+                product_dict["price"] = product_dict.get("price_eur", 0.0)
+            # Missing prices (+inf internally) are exposed as the legacy 9999 sentinel
+            if p.price >= MISSING_PRICE_SENTINEL:
+                product_dict["price"] = MISSING_PRICE_SENTINEL
+                product_dict["price_eur"] = MISSING_PRICE_SENTINEL
+            results.append(product_dict)
+        except Exception as e:
+            logger.error("Failed to serialize ProductPublic to dict: %s", e, exc_info=True)
+            continue
+    return results
 
 
 def _aggregated_search_uncached(
@@ -192,211 +561,85 @@ def _aggregated_search_uncached(
     logger.info("Search request: query=%r retailers=%r size_per_retailer=%d page=%d sort_by=%r health_filter=%r", 
                 query, retailers, size_per_retailer, page, sort_by, health_filter)
     
-    internal_products: List[ProductInternal] = []
-
-    # Get connector map dynamically to allow test patches to work
-    connector_map = _get_connector_map()
-    
     # Track connector results for logging
-    connector_results_count = {}
+    connector_results_count: Dict[str, int] = {}
     
     # Track connector status (optional, for debugging/UI hints)
     connector_status: Dict[str, str] = {}
     
-    # Iterate through requested retailers
+    # Skip invalid retailer names (and duplicates, which would be searched twice)
+    valid_retailers: List[str] = []
     for retailer in retailers:
-        # Skip invalid retailer names
-        if retailer not in connector_map:
+        if retailer not in SUPPORTED_RETAILERS:
             logger.warning("Unknown retailer '%s', skipping...", retailer)
-            continue
-
-        try:
-            # Instantiate connector for this retailer
-            logger.debug("Instantiating connector for retailer: %s", retailer)
-            try:
-                connector = connector_map[retailer]()
-            except PicnicAuthError as init_error:
-                # Picnic authentication failed during initialization
-                logger.warning("Picnic authentication failed; skipping Picnic: %s", str(init_error))
-                connector_results_count[retailer] = 0
-                connector_status[retailer] = "auth_error"
-                continue
-            except RuntimeError as init_error:
-                # Connector initialization failed (e.g., missing API token)
-                error_msg = str(init_error).lower()
-                if retailer == "picnic" and ("credential" in error_msg or "not configured" in error_msg):
-                    logger.warning("Picnic disabled: %s", init_error)
-                    connector_status[retailer] = "disabled"
-                else:
-                    logger.error("Failed to initialize %s connector: %s", retailer, init_error)
-                    connector_status[retailer] = "error"
-                connector_results_count[retailer] = 0
-                continue
-            except Exception as init_error:
-                logger.error("Unexpected error initializing %s connector: %s", retailer, init_error, exc_info=True)
-                connector_results_count[retailer] = 0
-                connector_status[retailer] = "error"
-                continue
-            
-            # Search products for this retailer (returns List[Dict[str, Any]])
-            logger.debug("Calling connector.search_products for %s with query=%r size=%d page=%d", 
-                        retailer, query, size_per_retailer, page)
-            try:
-                items = connector.search_products(query, size=size_per_retailer, page=page)
-                logger.info("Connector %s returned %d raw products", retailer, len(items) if items else 0)
-                connector_results_count[retailer] = len(items) if items else 0
-                # Mark as OK if search succeeded
-                if retailer not in connector_status:
-                    connector_status[retailer] = "ok"
-            except PicnicAuthError as search_error:
-                # Picnic auth error during search
-                logger.warning("Picnic authentication failed; skipping Picnic results: %s", str(search_error))
-                items = []
-                connector_results_count[retailer] = 0
-                connector_status[retailer] = "auth_error"
-            except RuntimeError as search_error:
-                # Config error during search
-                error_msg = str(search_error).lower()
-                if retailer == "picnic" and ("credential" in error_msg or "not configured" in error_msg):
-                    logger.warning("Picnic disabled during search: %s", search_error)
-                    connector_status[retailer] = "disabled"
-                else:
-                    logger.error("RuntimeError during %s search: %s", retailer, search_error)
-                    connector_status[retailer] = "error"
-                items = []
-                connector_results_count[retailer] = 0
-            except Exception as search_error:
-                # Other errors during search
-                logger.error("Unexpected error during %s search: %s", retailer, search_error, exc_info=True)
-                items = []
-                connector_results_count[retailer] = 0
-                connector_status[retailer] = "error"
-            
-            if not items:
-                logger.debug("No products returned from %s connector for query=%r", retailer, query)
-                continue
-            
-            # Convert dicts to ProductInternal for internal processing
-            mapped_count = 0
-            for item in items:
-                try:
-                    # Create a copy to avoid modifying the original
-                    item_copy = dict(item)
-                    # Track if price was originally missing (for sorting/final output)
-                    price_was_missing = "price" not in item_copy and "price_eur" not in item_copy
-                    
-                    # Normalize ID format: "{retailer}:{id}"
-                    if ":" not in str(item_copy.get("id", "")):
-                        item_copy["id"] = f"{retailer}:{item_copy.get('id', '')}"
-                    # Ensure price is set (use price_eur if price not present, default to 9999 for missing)
-                    if "price" not in item_copy:
-                        item_copy["price"] = item_copy.get("price_eur", 9999.0 if price_was_missing else 0.0)
-                    # Ensure price_eur is set for backward compatibility
-                    if "price_eur" not in item_copy:
-                        item_copy["price_eur"] = item_copy.get("price", 9999.0 if price_was_missing else 0.0)
-                    # Map url to product_url if needed
-                    if "product_url" not in item_copy and "url" in item_copy:
-                        item_copy["product_url"] = item_copy["url"]
-                    # Map raw to source_raw for ProductInternal
-                    if "raw" in item_copy and "source_raw" not in item_copy:
-                        item_copy["source_raw"] = item_copy["raw"]
-                    # Store original price state for final output
-                    item_copy["_price_was_missing"] = price_was_missing
-                    
-                    # Convert to ProductInternal - this may raise ValidationError if required fields are missing
-                    internal_product = ProductInternal(**item_copy)
-                    internal_products.append(internal_product)
-                    mapped_count += 1
-                except Exception as e:
-                    # Log validation/conversion errors but continue processing other items
-                    logger.error("Failed to convert product dict to ProductInternal for retailer %s: %s. Item: %s", 
-                                retailer, e, str(item)[:200], exc_info=True)
-                    continue
-            
-            logger.info("Connector %s: raw_count=%d mapped_to_ProductInternal=%d", 
-                       retailer, connector_results_count[retailer], mapped_count)
-            
-            # Mark connector as OK if we got here successfully
-            if retailer not in connector_status:
-                connector_status[retailer] = "ok"
-                
-        except PicnicAuthError as e:
-            # Picnic authentication error - log clearly and continue
-            logger.warning("Picnic authentication failed: %s. Skipping Picnic results for this request.", e)
-            connector_results_count[retailer] = 0
-            connector_status[retailer] = "auth_error"
-            continue
-        except RuntimeError as e:
-            # Connector initialization or config errors - log and continue
-            error_msg = str(e).lower()
-            if retailer == "picnic" and ("credential" in error_msg or "not configured" in error_msg):
-                logger.warning("Picnic disabled: %s", e)
-                connector_status[retailer] = "disabled"
-            else:
-                logger.error("RuntimeError searching %s: %s", retailer, e, exc_info=True)
-            connector_results_count[retailer] = 0
-            if retailer not in connector_status:
-                connector_status[retailer] = "error"
-            continue
-        except Exception as e:
-            # Log any other unexpected errors with full traceback
-            logger.error("Unexpected error searching %s: %s", retailer, e, exc_info=True)
-            connector_results_count[retailer] = 0
-            connector_status[retailer] = "error"
-            continue
-
-    logger.info("Total ProductInternal objects before health tagging: %d (from retailers: %s)", 
-                len(internal_products), connector_results_count)
+        elif retailer not in valid_retailers:
+            valid_retailers.append(retailer)
     
-    # Convert ProductInternal to ProductPublic and add health tags
-    public_products: List[ProductPublic] = []
+    # Public products per retailer, filled in as each search completes and concatenated
+    # in request order below so the (pre-sort) result order stays deterministic
+    products_by_retailer: Dict[str, List[ProductPublic]] = {}
+    internal_count = 0
     conversion_errors = 0
-    for internal_product in internal_products:
-        try:
-            # Tag health using the internal product's dict representation
-            product_dict = internal_product.model_dump()
-            # Ensure price_eur is in the dict for tag_health compatibility
-            if "price_eur" not in product_dict:
-                product_dict["price_eur"] = product_dict.get("price", 0.0)
-            health_tag = tag_health(product_dict)
-            
-            # Convert to ProductPublic (as dict first to add price_eur, then create model)
-            product_dict = {
-                "id": internal_product.id,
-                "retailer": internal_product.retailer,
-                "name": internal_product.name,
-                "brand": internal_product.brand,
-                "category": internal_product.category,
-                "image_url": internal_product.image_url,
-                "url": internal_product.product_url,  # Map product_url to url
-                "price": internal_product.price,
-                "price_eur": internal_product.price,  # Set price_eur for backward compatibility
-                "currency": internal_product.currency,
-                "price_per_unit": internal_product.price_per_unit,
-                "unit": internal_product.unit or internal_product.unit_size,  # Legacy unit field
-                "unit_size": internal_product.unit_size,  # Legacy field
-                "quantity": internal_product.quantity,
-                "quantity_unit": internal_product.quantity_unit,
-                "is_promotion": internal_product.is_promotion,
-                "promo_text": internal_product.promo_text,
-                "health_tag": health_tag,
-                "is_cheapest": None,  # Will be set by group_by_name_and_mark_cheapest
-                "is_cheapest_total": False,  # Will be set by mark_cheapest
-                "is_cheapest_per_unit": False,  # Will be set by mark_cheapest
-                "raw": internal_product.source_raw,
-            }
-            public_product = ProductPublic(**product_dict)
-            public_products.append(public_product)
-        except Exception as e:
-            # Log conversion errors but continue
-            logger.error("Failed to convert ProductInternal to ProductPublic: %s. Product ID: %s", 
-                        e, internal_product.id if hasattr(internal_product, 'id') else 'unknown', exc_info=True)
-            conversion_errors += 1
-            continue
+    
+    for retailer, outcome in _iter_search_outcomes(valid_retailers, query, size_per_retailer, page):
+        status, raw_count, internal_batch_count, public_batch, batch_errors = outcome
+        connector_status[retailer] = status
+        connector_results_count[retailer] = raw_count
+        products_by_retailer[retailer] = public_batch
+        internal_count += internal_batch_count
+        conversion_errors += batch_errors
+    
+    logger.info("Total ProductInternal objects: %d (from retailers: %s)", 
+                internal_count, connector_results_count)
     
     if conversion_errors > 0:
         logger.warning("Failed to convert %d ProductInternal objects to ProductPublic", conversion_errors)
     
+    result = _build_search_result(valid_retailers, products_by_retailer, connector_status, sort_by, health_filter)
+    
+    logger.info("Aggregated search response size: %d products (from retailers: %s, status: %s)", 
+                len(result["results"]), connector_results_count, connector_status)
+    
+    # Log Picnic status specifically if it's not OK
+    if "picnic" in connector_status and connector_status["picnic"] != "ok":
+        logger.info("Picnic status: %s (AH and Jumbo results are unaffected)", connector_status["picnic"])
+    
+    return result
+
+
+def _build_search_result(
+    valid_retailers: List[str],
+    products_by_retailer: Dict[str, List[ProductPublic]],
+    connector_status: Dict[str, str],
+    sort_by: Optional[str],
+    health_filter: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Merge per-retailer products into the final aggregated search response.
+    
+    Shared by aggregated_search and iter_search_batches, so a streamed search caches
+    and records exactly what /search would have returned. Applies the health filter,
+    marks cheapest products, sorts, serializes and records prices to history.
+    
+    Args:
+        valid_retailers: Searched retailers, in request order (sets the pre-sort order)
+        products_by_retailer: Public products per retailer
+        connector_status: Status string per searched retailer
+        sort_by: Sort criterion (see sort_products)
+        health_filter: Optional filter for health tag - "healthy" or "unhealthy"
+        
+    Returns:
+        Dictionary with results (product dicts) and connectors_status
+    """
+    if len(valid_retailers) == 1:
+        public_products = products_by_retailer.get(valid_retailers[0], [])
+    else:
+        public_products = [
+            product
+            for retailer in valid_retailers
+            for product in products_by_retailer.get(retailer, [])
+        ]
+    
     logger.info("Total ProductPublic objects after conversion: %d", len(public_products))
 
     # Apply health filter if specified
@@ -410,15 +653,15 @@ def _aggregated_search_uncached(
 
     # Mark cheapest products across all results (not grouped by name)
     # This marks is_cheapest_total and is_cheapest_per_unit flags
-    public_products = mark_cheapest(public_products)
+    # Both passes update the flags in place
+    mark_cheapest(public_products)
     logger.debug("Marked cheapest products: total price and price per unit")
     
     # Also group by name and mark cheapest in each group (for backward compatibility)
     # This updates is_cheapest to match name-grouped logic, while keeping is_cheapest_total
     # and is_cheapest_per_unit for the new comparison logic
-    before_grouping = len(public_products)
-    public_products = group_by_name_and_mark_cheapest(public_products)
-    logger.debug("Grouped by name: %d -> %d products (should be same)", before_grouping, len(public_products))
+    group_by_name_and_mark_cheapest(public_products)
+    logger.debug("Grouped by name and marked cheapest per group")
 
     # Sort results using the new comparison module
     public_products = sort_products(public_products, sort_by)
@@ -426,32 +669,7 @@ def _aggregated_search_uncached(
 
     # Convert to dict format for backward compatibility with existing API
     # This maintains compatibility with the current API layer that expects dicts
-    # Ensure both price and price_eur are present in the dict for backward compatibility
-    results = []
-    for p in public_products:
-        try:
-            product_dict = p.model_dump(mode="json", by_alias=True)
-            # Ensure price_eur is present (backward compatibility)
-            if "price_eur" not in product_dict:
-                product_dict["price_eur"] = product_dict.get("price", 0.0)
-            # Also ensure price is present
-            if "price" not in product_dict:
-                product_dict["price"] = product_dict.get("price_eur", 0.0)
-            # For missing prices, ensure price_eur is 9999 (matches sorting logic expectation)
-            # The test accepts either None or 9999, but sorting uses 9999, so use 9999
-            if product_dict.get("price", 0) >= 9999.0:
-                product_dict["price_eur"] = 9999.0
-            results.append(product_dict)
-        except Exception as e:
-            logger.error("Failed to serialize ProductPublic to dict: %s", e, exc_info=True)
-            continue
-    
-    logger.info("Aggregated search response size: %d products (from retailers: %s, status: %s)", 
-                len(results), connector_results_count, connector_status)
-    
-    # Log Picnic status specifically if it's not OK
-    if "picnic" in connector_status and connector_status["picnic"] != "ok":
-        logger.info("Picnic status: %s (AH and Jumbo results are unaffected)", connector_status["picnic"])
+    results = _products_to_dicts(public_products)
     
     # Record prices to history (demo feature - non-blocking)
     try:
@@ -468,6 +686,12 @@ def _aggregated_search_uncached(
     }
 
 
+# Searches currently being fetched, keyed by cache key. Concurrent callers with the
+# same key wait on the leader's Future instead of repeating the retailer fan-out.
+_INFLIGHT_SEARCHES: Dict[Hashable, "Future[Dict[str, Any]]"] = {}
+_INFLIGHT_SEARCHES_LOCK = threading.Lock()
+
+
 def aggregated_search(
     query: str,
     retailers: List[str],
@@ -481,6 +705,8 @@ def aggregated_search(
     
     This is the main entry point that wraps _aggregated_search_uncached with a TTL cache.
     Cache key is based on all search parameters to ensure correctness.
+    Concurrent calls with the same key share one upstream search: the first caller
+    fetches, the others wait for and return its result.
     
     Args:
         query: Search query string (e.g., "melk", "brood")
@@ -497,6 +723,14 @@ def aggregated_search(
         
     See _aggregated_search_uncached() docstring for detailed return format.
     """
+    # Nothing to fetch: skip the cache and the whole pipeline
+    if not retailers or size_per_retailer <= 0:
+        logger.debug("Empty search request (retailers=%r size_per_retailer=%d)", retailers, size_per_retailer)
+        return {
+            "results": [],
+            "connectors_status": {retailer: "skipped" for retailer in (retailers or [])},
+        }
+    
     # Create cache key from all parameters
     cache_key = make_search_cache_key(
         query=query,
@@ -513,20 +747,168 @@ def aggregated_search(
         logger.debug("Cache hit for query=%r retailers=%r", query, retailers)
         return cached_result
     
-    # Cache miss - perform actual search
+    # Cache miss - join an identical search that is already in flight, if any
+    with _INFLIGHT_SEARCHES_LOCK:
+        inflight = _INFLIGHT_SEARCHES.get(cache_key)
+        if inflight is None:
+            future: "Future[Dict[str, Any]]" = Future()
+            _INFLIGHT_SEARCHES[cache_key] = future
+    if inflight is not None:
+        logger.debug("Joining in-flight search for query=%r retailers=%r", query, retailers)
+        return inflight.result()
+    
+    # Perform actual search
     logger.debug("Cache miss for query=%r retailers=%r - performing search", query, retailers)
-    result = _aggregated_search_uncached(
+    try:
+        result = _aggregated_search_uncached(
+            query=query,
+            retailers=retailers,
+            size_per_retailer=size_per_retailer,
+            page=page,
+            sort_by=sort_by,
+            health_filter=health_filter,
+        )
+        
+        # Cache successful results (only cache if we got a valid response)
+        if result is not None and isinstance(result, dict) and "results" in result:
+            set_cached_search(cache_key, result)
+            logger.debug("Cached search result for query=%r retailers=%r", query, retailers)
+        
+        future.set_result(result)
+    except BaseException as e:
+        # Waiting callers see the same error as the leader
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_SEARCHES_LOCK:
+            _INFLIGHT_SEARCHES.pop(cache_key, None)
+    
+    return result
+
+
+async def aggregated_search_async(
+    query: str,
+    retailers: List[str],
+    size_per_retailer: int = 10,
+    page: int = 0,
+    sort_by: Optional[str] = None,
+    health_filter: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Async variant of aggregated_search for use from an event loop.
+    
+    The retailer SDKs (apify-client, python-picnic-api) are synchronous, so the search
+    runs on a worker thread (where retailers are still fetched concurrently) and the
+    event loop stays free to serve other requests meanwhile. In-memory cache hits are
+    answered without leaving the event loop; when the cache is backed by Redis, the
+    lookup is network I/O and is left to the worker thread.
+    
+    Args/Returns: same as aggregated_search().
+    """
+    if not redis_cache_active():
+        cached_result = get_cached_search(make_search_cache_key(
+            query=query,
+            retailers=retailers,
+            size=size_per_retailer,
+            page=page,
+            sort_by=sort_by,
+            health_filter=health_filter,
+        ))
+        if cached_result is not None:
+            logger.debug("Cache hit for query=%r retailers=%r", query, retailers)
+            return cached_result
+    
+    return await asyncio.to_thread(
+        aggregated_search,
+        query,
+        retailers,
+        size_per_retailer=size_per_retailer,
+        page=page,
+        sort_by=sort_by,
+        health_filter=health_filter,
+    )
+
+
+def iter_search_batches(
+    query: str,
+    retailers: List[str],
+    size_per_retailer: int = 10,
+    page: int = 0,
+    sort_by: Optional[str] = None,
+    health_filter: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Search retailers and yield each retailer's results as soon as that retailer completes.
+    
+    Streaming counterpart of aggregated_search, sharing its search cache:
+    - Cache hit: one batch per retailer is cut from the cached response (request order,
+      cheapest flags set as in /search).
+    - Cache miss: batches are yielded in completion order, so the first one is available
+      after the fastest retailer answers. Each is health-filtered and sorted on its own;
+      cheapest flags need the full result set, so they are left unset. Once every
+      retailer has answered, the merged response is built and cached (and its prices
+      recorded) exactly as aggregated_search would have, so a following /search is a hit.
+    
+    Args:
+        query: Search query string (e.g., "melk", "brood")
+        retailers: List of retailer identifiers to search; unknown ones are skipped
+        size_per_retailer: Number of results to fetch from each retailer (default: 10)
+        page: Page number for pagination (0-indexed, default: 0)
+        sort_by: Sort criterion applied within each batch (default: None, preserves order)
+        health_filter: Optional filter for health tag - "healthy" or "unhealthy" (default: None)
+        
+    Yields:
+        Dictionary per retailer containing:
+        - retailer: Retailer identifier
+        - status: Connector status string ("ok", "error", ...)
+        - results: List of product dictionaries (same format as aggregated_search results)
+    """
+    valid_retailers = list(dict.fromkeys(r for r in retailers if r in SUPPORTED_RETAILERS))
+    if not valid_retailers or size_per_retailer <= 0:
+        return
+    
+    cache_key = make_search_cache_key(
         query=query,
         retailers=retailers,
-        size_per_retailer=size_per_retailer,
+        size=size_per_retailer,
         page=page,
         sort_by=sort_by,
         health_filter=health_filter,
     )
+    cached_result = get_cached_search(cache_key)
+    if cached_result is not None:
+        logger.debug("Cache hit for streamed query=%r retailers=%r", query, retailers)
+        # The cached list is sorted as a whole, so each retailer's subset keeps that order
+        results_by_retailer: Dict[str, List[Dict[str, Any]]] = {r: [] for r in valid_retailers}
+        for product in cached_result.get("results", []):
+            batch = results_by_retailer.get(product.get("retailer"))
+            if batch is not None:
+                batch.append(product)
+        connectors_status = cached_result.get("connectors_status", {})
+        for retailer in valid_retailers:
+            yield {
+                "retailer": retailer,
+                "status": connectors_status.get(retailer, "ok"),
+                "results": results_by_retailer[retailer],
+            }
+        return
     
-    # Cache successful results (only cache if we got a valid response)
-    if result is not None and isinstance(result, dict) and "results" in result:
-        set_cached_search(cache_key, result)
-        logger.debug("Cached search result for query=%r retailers=%r", query, retailers)
+    health_filter_lower = health_filter.lower() if health_filter else None
+    products_by_retailer: Dict[str, List[ProductPublic]] = {}
+    connector_status: Dict[str, str] = {}
     
-    return result
+    for retailer, outcome in _iter_search_outcomes(valid_retailers, query, size_per_retailer, page):
+        status, _, _, public_products, _ = outcome
+        connector_status[retailer] = status
+        products_by_retailer[retailer] = public_products
+        if health_filter_lower in ("healthy", "unhealthy"):
+            public_products = [p for p in public_products if p.health_tag == health_filter_lower]
+        yield {
+            "retailer": retailer,
+            "status": status,
+            "results": _products_to_dicts(sort_products(public_products, sort_by)),
+        }
+    
+    # Every retailer has answered: cache the merged response for /search and later streams
+    result = _build_search_result(valid_retailers, products_by_retailer, connector_status, sort_by, health_filter)
+    set_cached_search(cache_key, result)
@@ -9,15 +9,16 @@ Note: This is a process-local, non-persistent implementation suitable for MVP.
 In production, this should be replaced with a database-backed solution.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, List
+import threading
 import time
 import uuid
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SavedBasketTemplate:
-    """Represents a saved basket template."""
+    """Represents a saved basket template (immutable once saved)."""
     id: str
     name: str
     created_at: float
@@ -25,9 +26,13 @@ class SavedBasketTemplate:
 
 
 # In-memory store: session_id -> template_id -> SavedBasketTemplate
+# Each session dict is in creation order: save_template_for_session only appends new ids
 # In production, this would be replaced with a database (e.g., PostgreSQL, Redis)
 _TEMPLATES_STORE: Dict[str, Dict[str, SavedBasketTemplate]] = {}
 
+# Guards _TEMPLATES_STORE; API requests run on multiple worker threads
+_TEMPLATES_LOCK = threading.RLock()
+
 
 def list_templates_for_session(session_id: str) -> List[SavedBasketTemplate]:
     """
@@ -39,10 +44,9 @@ def list_templates_for_session(session_id: str) -> List[SavedBasketTemplate]:
     Returns:
         List of SavedBasketTemplate objects, sorted by creation time (newest first)
     """
-    templates = list(_TEMPLATES_STORE.get(session_id, {}).values())
-    # Sort by created_at descending (newest first)
-    templates.sort(key=lambda t: t.created_at, reverse=True)
-    return templates
+    # Session dicts are in insertion (= creation) order, so newest first is just reversed
+    with _TEMPLATES_LOCK:
+        return list(reversed(_TEMPLATES_STORE.get(session_id, {}).values()))
 
 
 def save_template_for_session(session_id: str, name: str, items: List[Dict]) -> SavedBasketTemplate:
@@ -57,15 +61,15 @@ def save_template_for_session(session_id: str, name: str, items: List[Dict]) ->
     Returns:
         Saved SavedBasketTemplate object
     """
-    templates = _TEMPLATES_STORE.setdefault(session_id, {})
-    template_id = str(uuid.uuid4())
-    template = SavedBasketTemplate(
-        id=template_id,
-        name=name.strip() or "Unnamed basket",
-        created_at=time.time(),
-        items=items,
-    )
-    templates[template_id] = template
+    template_id = uuid.uuid4().hex
+    with _TEMPLATES_LOCK:
+        template = SavedBasketTemplate(
+            id=template_id,
+            name=name.strip() or "Unnamed basket",
+            created_at=time.time(),
+            items=items,
+        )
+        _TEMPLATES_STORE.setdefault(session_id, {})[template_id] = template
     return template
 
 
@@ -80,7 +84,8 @@ def get_template_for_session(session_id: str, template_id: str) -> SavedBasketTe
     Returns:
         SavedBasketTemplate if found, None otherwise
     """
-    return _TEMPLATES_STORE.get(session_id, {}).get(template_id)
+    with _TEMPLATES_LOCK:
+        return _TEMPLATES_STORE.get(session_id, {}).get(template_id)
 
 
 def delete_template_for_session(session_id: str, template_id: str) -> None:
@@ -91,13 +96,14 @@ def delete_template_for_session(session_id: str, template_id: str) -> None:
         session_id: Session identifier
         template_id: Template identifier to delete
     """
-    session_templates = _TEMPLATES_STORE.get(session_id)
-    if not session_templates:
-        return
-    
-    session_templates.pop(template_id, None)
-    
-    # Clean up empty session entries
-    if not session_templates:
-        _TEMPLATES_STORE.pop(session_id, None)
+    with _TEMPLATES_LOCK:
+        session_templates = _TEMPLATES_STORE.get(session_id)
+        if not session_templates:
+            return
+        
+        session_templates.pop(template_id, None)
+        
+        # Clean up empty session entries
+        if not session_templates:
+            _TEMPLATES_STORE.pop(session_id, None)
 
@@ -1,22 +1,97 @@
 """
-In-process TTL cache for search queries.
+TTL cache for search queries.
 
 This module provides a simple, lightweight cache for aggregated search results
 to reduce redundant API calls to external retailers while keeping results fresh.
 
-The cache is process-local and in-memory, with automatic expiration based on TTL.
+By default the cache is process-local and in-memory, with automatic expiration based
+on TTL and a bounded size (least recently used entries are evicted first).
+
+When the REDIS_URL environment variable is set (and the redis package is installed),
+results are stored in Redis instead, so all API workers share one cache and it
+survives restarts. If Redis is unreachable, the in-memory cache is used, and Redis
+is not tried again for a short cooldown so a dead server does not add its timeouts
+to every search.
 """
 
+import hashlib
+import json
+import logging
+import os
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Dict, Hashable, Optional, Tuple
 
-# Cache storage: Dict[Hashable, Tuple[float, Dict[str, Any]]]
-# Key -> (timestamp, cached_value)
-_SEARCH_CACHE: Dict[Hashable, Tuple[float, Dict[str, Any]]] = {}
+logger = logging.getLogger(__name__)
+
+# Cache storage: OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]
+# Key -> (timestamp, cached_value), ordered from least to most recently used
+_SEARCH_CACHE: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Guards _SEARCH_CACHE; searches run from multiple worker threads
+_SEARCH_CACHE_LOCK = threading.Lock()
 
 # TTL in seconds - 60 seconds balances freshness with API call reduction
 SEARCH_CACHE_TTL_SECONDS = 60
 
+# Upper bound on cached entries; the least recently used entry is evicted first
+SEARCH_CACHE_MAX_SIZE = 1024
+
+# Shared cache configuration
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_ENABLED = bool(REDIS_URL)
+
+# Prefix for search cache keys in Redis (keeps them apart from other data in the same DB)
+REDIS_KEY_PREFIX = "nl-grocery:search:"
+
+# After a Redis error, use the in-memory cache for this long before trying Redis again
+REDIS_RETRY_COOLDOWN_SECONDS = 30.0
+
+# Redis client (optional - only used if REDIS_ENABLED)
+_redis_client = None
+
+# time.monotonic() until which Redis is skipped after a failure
+_redis_retry_at = 0.0
+
+if REDIS_ENABLED:
+    try:
+        import redis
+        _redis_client = redis.Redis.from_url(REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+        logger.info("Search cache backed by Redis (REDIS_URL is set)")
+    except ImportError:
+        logger.warning("REDIS_URL is set but redis is not installed. Install with: pip install redis")
+        REDIS_ENABLED = False
+    except Exception as e:
+        logger.error(f"Failed to initialize Redis search cache: {e}")
+        REDIS_ENABLED = False
+
+
+def redis_cache_active() -> bool:
+    """
+    Check whether cache reads and writes currently go to Redis.
+    
+    False when Redis is not configured or is cooling down after a failure; the cache is
+    then purely in-memory and never blocks on network I/O.
+    """
+    return REDIS_ENABLED and time.monotonic() >= _redis_retry_at
+
+
+def _redis_failed(action: str, error: Exception) -> None:
+    """Log a Redis error and skip Redis for REDIS_RETRY_COOLDOWN_SECONDS."""
+    global _redis_retry_at
+    _redis_retry_at = time.monotonic() + REDIS_RETRY_COOLDOWN_SECONDS
+    logger.warning(
+        "Redis search cache %s failed, using in-memory cache for %.0fs: %s",
+        action, REDIS_RETRY_COOLDOWN_SECONDS, error,
+    )
+
+
+def _redis_key(key: Hashable) -> str:
+    """Map a make_search_cache_key() tuple to a short, stable Redis key."""
+    digest = hashlib.sha1(json.dumps(key, separators=(",", ":")).encode("utf-8")).hexdigest()
+    return REDIS_KEY_PREFIX + digest
+
 
 def make_search_cache_key(
     query: str,
@@ -65,22 +140,31 @@ def get_cached_search(key: Hashable) -> Optional[Dict[str, Any]]:
     Returns:
         Cached result dictionary, or None if not found or expired
     """
-    now = time.time()
-    entry = _SEARCH_CACHE.get(key)
+    if redis_cache_active():
+        try:
+            payload = _redis_client.get(_redis_key(key))
+            return json.loads(payload) if payload is not None else None
+        except Exception as e:
+            _redis_failed("read", e)
     
-    if not entry:
-        return None
-    
-    timestamp, value = entry
-    
-    # Check if expired
-    if now - timestamp > SEARCH_CACHE_TTL_SECONDS:
-        # Expired - remove from cache
-        _SEARCH_CACHE.pop(key, None)
-        return None
-    
-    # Cache hit - return cached value
-    return value
+    now = time.time()
+    with _SEARCH_CACHE_LOCK:
+        entry = _SEARCH_CACHE.get(key)
+        
+        if not entry:
+            return None
+        
+        timestamp, value = entry
+        
+        # Check if expired
+        if now - timestamp > SEARCH_CACHE_TTL_SECONDS:
+            # Expired - remove from cache
+            del _SEARCH_CACHE[key]
+            return None
+        
+        # Cache hit - mark as most recently used and return cached value
+        _SEARCH_CACHE.move_to_end(key)
+        return value
 
 
 def set_cached_search(key: Hashable, value: Dict[str, Any]) -> None:
@@ -91,15 +175,60 @@ def set_cached_search(key: Hashable, value: Dict[str, Any]) -> None:
         key: Cache key from make_search_cache_key()
         value: Result dictionary to cache (must be {"results": [...], "connectors_status": {...}})
     """
-    _SEARCH_CACHE[key] = (time.time(), value)
+    if redis_cache_active():
+        try:
+            _redis_client.set(_redis_key(key), json.dumps(value), ex=SEARCH_CACHE_TTL_SECONDS)
+            return
+        except Exception as e:
+            _redis_failed("write", e)
+    
+    now = time.time()
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[key] = (now, value)
+        _SEARCH_CACHE.move_to_end(key)
+        
+        # Drop expired entries from the cold end, then enforce the size bound
+        while _SEARCH_CACHE:
+            oldest_key, (timestamp, _) = next(iter(_SEARCH_CACHE.items()))
+            if now - timestamp <= SEARCH_CACHE_TTL_SECONDS and len(_SEARCH_CACHE) <= SEARCH_CACHE_MAX_SIZE:
+                break
+            del _SEARCH_CACHE[oldest_key]
+
+
+# Number of Redis keys scanned and unlinked per round trip in clear_cache()
+REDIS_CLEAR_BATCH_SIZE = 500
 
 
-def clear_cache() -> None:
-    """Clear all cached search results (useful for testing)."""
-    _SEARCH_CACHE.clear()
+def clear_cache() -> int:
+    """
+    Clear all cached search results (in-memory, and Redis when enabled).
+    
+    Redis keys are removed with UNLINK in batches, one round trip per batch.
+    
+    Returns:
+        Number of cache entries removed (in-memory entries plus Redis keys)
+    """
+    with _SEARCH_CACHE_LOCK:
+        cleared = len(_SEARCH_CACHE)
+        _SEARCH_CACHE.clear()
+    
+    if REDIS_ENABLED:
+        try:
+            batch = []
+            for redis_key in _redis_client.scan_iter(match=REDIS_KEY_PREFIX + "*", count=REDIS_CLEAR_BATCH_SIZE):
+                batch.append(redis_key)
+                if len(batch) >= REDIS_CLEAR_BATCH_SIZE:
+                    cleared += _redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                cleared += _redis_client.unlink(*batch)
+        except Exception as e:
+            logger.warning("Failed to clear Redis search cache: %s", e)
+    
+    return cleared
 
 
 def get_cache_size() -> int:
-    """Get the current number of cached entries (useful for monitoring)."""
+    """Get the current number of in-memory cached entries (useful for monitoring)."""
     return len(_SEARCH_CACHE)
 
@@ -9,12 +9,14 @@ stateless and have no side effects (no I/O, no network calls).
     retailers into a canonical format for consistent comparison and display.
 """
 
+import functools
 import re
+from types import MappingProxyType
 from typing import Optional, Tuple
 
 
-# Canonical unit mappings
-_CANONICAL_UNITS = {
+# Canonical unit mappings (read-only: canonicalize_unit memoizes lookups into it)
+_CANONICAL_UNITS = MappingProxyType({
     # Volume
     "l": "L",
     "liter": "L",
@@ -40,13 +42,22 @@ _CANONICAL_UNITS = {
     "pcs": "piece",
     "pc": "piece",
     "x": "piece",  # Common in "6 x 250ml"
-}
+})
 
+# Size string patterns, compiled once (parse_quantity_and_unit runs per product per search)
+# Multi-pack formats like "2 x 330 ml", "6-pack x 250ml", "3x 500g"
+_MULTI_PACK_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*(?:-?pack\s*)?[xX×]\s*(\d+(?:[.,]\d+)?)\s*([a-zA-Z]+)", re.IGNORECASE)
+# Simple formats like "1 kg", "500 g", "1L", "250ml", "3 stuks"
+_SIMPLE_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*([a-zA-Z]+)", re.IGNORECASE)
 
+
+@functools.lru_cache(maxsize=1024)
 def canonicalize_unit(unit: str) -> str:
     """
     Normalize unit strings to canonical form.
     
+    Results are memoized: retailer feeds repeat a small set of unit strings.
+    
     Converts synonyms and variants to a canonical set:
     - Volume: "l", "liter", "ltr" -> "L"; "ml", "milliliter" -> "mL"
     - Mass: "kg", "kilogram" -> "kg"; "g", "gram", "gr" -> "g"
@@ -105,33 +116,19 @@ def parse_quantity_and_unit(raw_size_str: str) -> Tuple[Optional[float], Optiona
     if not raw_size_str:
         return None, None
     
-    # Pattern 1: Multi-pack formats like "2 x 330 ml", "6-pack x 250ml", "3x 500g"
-    multi_pack_pattern = r"(\d+(?:[\.,]\d+)?)\s*(?:-?pack\s*)?[xX×]\s*(\d+(?:[\.,]\d+)?)\s*([a-zA-Z]+)"
-    match = re.search(multi_pack_pattern, raw_size_str, re.IGNORECASE)
-    if match:
-        try:
-            multiplier = float(match.group(1).replace(",", "."))
-            quantity = float(match.group(2).replace(",", "."))
-            unit_str = match.group(3)
-            total_quantity = multiplier * quantity
-            canonical_unit = canonicalize_unit(unit_str)
-            return total_quantity, canonical_unit
-        except (ValueError, IndexError):
-            pass
-    
-    # Pattern 2: Simple formats like "1 kg", "500 g", "1L", "250ml", "3 stuks"
-    simple_pattern = r"(\d+(?:[\.,]\d+)?)\s*([a-zA-Z]+)"
-    match = re.search(simple_pattern, raw_size_str, re.IGNORECASE)
-    if match:
-        try:
-            quantity = float(match.group(1).replace(",", "."))
-            unit_str = match.group(2)
-            canonical_unit = canonicalize_unit(unit_str)
-            return quantity, canonical_unit
-        except (ValueError, IndexError):
-            pass
-    
-    # If no pattern matches, return None
+    # The multi-pack pattern is searched across the whole string first, so a pack size
+    # later in the string ("1 doos 10 x 20 g") wins over a leading simple quantity
+    match = _MULTI_PACK_RE.search(raw_size_str)
+    if match is not None:
+        multiplier = float(match.group(1).replace(",", "."))
+        quantity = float(match.group(2).replace(",", "."))
+        return multiplier * quantity, canonicalize_unit(match.group(3))
+    
+    match = _SIMPLE_RE.search(raw_size_str)
+    if match is not None:
+        quantity = float(match.group(1).replace(",", "."))
+        return quantity, canonicalize_unit(match.group(2))
+    
     return None, None
 
 
@@ -5,8 +5,9 @@ This module centralizes environment variable loading from .env file at project r
 It should be imported early in both backend (api/main.py) and frontend (streamlit_app/app.py)
 to ensure .env is loaded before any other code accesses environment variables.
 
-On Render/production, .env will not exist, but load_dotenv() is safe to call and will no-op.
-Environment variables from Render dashboard will be used instead.
+On Render/production, .env will not exist and loading is skipped entirely (detected via
+the RENDER variable, or set DOTENV_DISABLE=1). Environment variables from the Render
+dashboard will be used instead.
 
 Environment Variables:
 - APIFY_TOKEN: Required for AH and Jumbo connectors (Apify API token)
@@ -16,38 +17,53 @@ Environment Variables:
 - PICNIC_PASSWORD: Required for Picnic connector
 - PICNIC_COUNTRY_CODE: Optional, defaults to "NL"
 - BACKEND_URL: Optional, backend URL (defaults to http://localhost:8000 for local dev)
+- DOTENV_DISABLE: Optional, set to "1" to never read .env (implied when RENDER is set)
+- API_DOCS_DISABLE: Optional, set to "1" to turn off /docs, /redoc and /openapi.json
+- ADMIN_TOKEN: Optional, enables the /admin endpoints for requests sending it in X-Admin-Token
 """
 
 import os
 from pathlib import Path
 from typing import Optional
 
-try:
-    from dotenv import load_dotenv
-    _DOTENV_AVAILABLE = True
-except ImportError:
-    _DOTENV_AVAILABLE = False
-    load_dotenv = None
+# .env at the project root: api/config.py -> api/ -> project root
+_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+
+# Set once .env has been loaded; later load_env_file() calls are no-ops
+_ENV_LOADED = False
 
 
 def load_env_file() -> None:
     """
     Load environment variables from .env file at project root.
     
-    This function locates the project root by going up from this file's location
-    (api/config.py -> project root) and loads .env if it exists.
+    Loads .env from the project root (located once at import, from this file's
+    location: api/config.py -> project root) if it exists.
     
-    Safe to call multiple times. On Render/production where .env doesn't exist,
-    this is a no-op and platform environment variables will be used.
+    Safe to call multiple times: only the first call reads the file. On Render/production
+    where .env doesn't exist, this is a no-op and platform environment variables will be used.
     """
-    if _DOTENV_AVAILABLE and load_dotenv:
-        # Get project root: api/config.py -> api/ -> project root
-        this_file = Path(__file__).resolve()
-        project_root = this_file.parent.parent
-        env_path = project_root / ".env"
-        
-        # Load .env if it exists (override=False means existing env vars take precedence)
-        load_dotenv(env_path, override=False)
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+    
+    # Render sets RENDER in its runtime; DOTENV_DISABLE=1 opts out elsewhere.
+    # Either way the platform environment is authoritative, so skip the file check.
+    if os.environ.get("RENDER") or os.environ.get("DOTENV_DISABLE") == "1":
+        return
+    
+    if not _ENV_PATH.is_file():
+        return
+    
+    # python-dotenv is only imported when there is a .env file to read
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    
+    # override=False means existing env vars take precedence
+    load_dotenv(_ENV_PATH, override=False)
 
 
 # Load .env file on module import (if available)
@@ -55,6 +71,26 @@ def load_env_file() -> None:
 load_env_file()
 
 
+def api_docs_enabled() -> bool:
+    """
+    Whether the API serves its interactive docs and OpenAPI schema.
+    
+    Returns:
+        False when API_DOCS_DISABLE=1, True otherwise (the default)
+    """
+    return os.environ.get("API_DOCS_DISABLE") != "1"
+
+
+def get_admin_token() -> Optional[str]:
+    """
+    Get the token that unlocks the /admin endpoints.
+    
+    Returns:
+        ADMIN_TOKEN value, or None if unset or empty (admin endpoints are then disabled)
+    """
+    return os.environ.get("ADMIN_TOKEN") or None
+
+
 class ApifyConfig:
     """Configuration for Apify-based connectors (AH and Jumbo)."""
     
@@ -171,4 +207,3 @@ def validate_required_config() -> None:
             "\n".join(f"  - {var}" for var in missing) +
             "\n\nPlease create a .env file at the project root with these variables."
         )
-
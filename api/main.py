@@ -14,6 +14,8 @@ header is provided, a default session ID is used (for development/testing).
 Run the API with:
     uvicorn api.main:app --reload
 
+In production (see render.yaml), uvicorn is started with --loop uvloop --http httptools.
+
 Access API documentation at:
     http://localhost:8000/docs (Swagger UI)
     http://localhost:8000/redoc (ReDoc)
@@ -23,15 +25,35 @@ Access API documentation at:
 # This ensures local development uses .env file, while Render uses platform env vars
 import api.config  # noqa: F401
 
+import asyncio
+import functools
+import hashlib
+import json
+import secrets
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from fastapi import FastAPI, Header, Query, HTTPException, status
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, Query, HTTPException, Request, Response, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
-from aggregator.search import aggregated_search
+from aggregator.search import (
+    SUPPORTED_RETAILERS,
+    aggregated_search,
+    aggregated_search_async,
+    get_connector,
+    iter_search_batches,
+    reset_connector,
+)
+from aggregator.savings import find_basket_savings
+from aggregator.db import db_is_enabled, init_db
+from aggregator.utils.cache import clear_cache
 from aggregator.cart import get_cart, add_to_cart, remove_from_cart, replace_cart
 from aggregator.models import CartItem, Cart
 from aggregator.templates import (
+    SavedBasketTemplate,
     list_templates_for_session,
     save_template_for_session,
     get_template_for_session,
@@ -46,18 +68,18 @@ from aggregator.events import (
     log_swap_clicked,
     log_recipe_viewed,
 )
-from aggregator.connectors.ah_connector import AHConnector
+from aggregator.connectors.picnic_connector import PicnicAuthError
 from api.routers import analytics
-from aggregator.connectors.jumbo_connector import JumboConnector
-from aggregator.connectors.picnic_connector import PicnicConnector
 from api.schemas import (
-    ProductBase,
     SearchResponse,
+    SearchStreamBatch,
     CartItemInput,
     CartView,
-    CartItemOut,
     BasketSavingsResponse,
+    SavingsProduct,
+    SavingsSuggestion,
     BasketTemplate,
+    BasketTemplateItem,
     BasketTemplateListResponse,
     SaveBasketTemplateRequest,
     SaveBasketTemplateResponse,
@@ -66,10 +88,16 @@ from api.schemas import (
 # Track app start time for uptime calculation
 _APP_START_TIME = time.time()
 
+# Interactive docs and the OpenAPI schema can be switched off with API_DOCS_DISABLE=1
+_DOCS_ENABLED = api.config.api_docs_enabled()
+
 app = FastAPI(
     title="NL Grocery Aggregator API",
     description="Backend API for aggregating grocery products from Albert Heijn, Jumbo, Picnic, and Dirk",
     version="1.0.0",
+    docs_url="/docs" if _DOCS_ENABLED else None,
+    redoc_url="/redoc" if _DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if _DOCS_ENABLED else None,
     tags_metadata=[
         {
             "name": "search",
@@ -94,24 +122,42 @@ app = FastAPI(
     ],
 )
 
-# Valid retailer identifiers
-VALID_RETAILERS = {"ah", "jumbo", "picnic", "dirk"}
-
-# Initialize database if DATABASE_URL is set
-try:
-    from aggregator.db import db_is_enabled, init_db
-    
-    if db_is_enabled():
-        try:
-            init_db()
-        except Exception as e:
-            # Log error but don't crash the app - fallback to in-memory/file storage
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Database initialization failed, using fallback storage: {e}")
-except ImportError:
-    # SQLAlchemy not installed - that's fine, we'll use fallback storage
-    pass
+# Valid retailer identifiers (the search connector table's frozenset, so the two cannot drift)
+VALID_RETAILERS = SUPPORTED_RETAILERS
+VALID_RETAILERS_SORTED_STR = ", ".join(sorted(VALID_RETAILERS))
+
+# Valid /search sort_by values (legacy and new format)
+VALID_SORT_OPTIONS = frozenset({
+    "price", "price_asc", "price_desc",
+    "price_per_unit", "price_per_unit_asc", "price_per_unit_desc",
+    "retailer", "health",
+})
+VALID_SORT_OPTIONS_SORTED_STR = ", ".join(sorted(VALID_SORT_OPTIONS))
+
+# Valid /search health_filter values
+VALID_HEALTH_FILTERS = frozenset({"healthy", "unhealthy"})
+
+# Initialize database if DATABASE_URL is set (aggregator.db imports without SQLAlchemy;
+# db_is_enabled() is then False and the fallback storage is used)
+if db_is_enabled():
+    try:
+        init_db()
+    except Exception as e:
+        # Log error but don't crash the app - fallback to in-memory/file storage
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.warning(f"Database initialization failed, using fallback storage: {e}")
+
+# Compress JSON responses (search results repeat field names and URLs). Small bodies
+# are not worth the CPU; level 5 keeps most of the size win at a lower cost than 9.
+# NDJSON streams are excluded: the compressor would buffer small batches and delay
+# the first line, which is the point of /search/stream.
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=500,
+    compresslevel=5,
+    exclude_content_types=DEFAULT_EXCLUDED_CONTENT_TYPES + ("application/x-ndjson",),
+)
 
 # Register routers
 app.include_router(analytics.router)
@@ -139,37 +185,85 @@ def get_session(x_session_id: Optional[str] = Header(None, alias="X-Session-ID")
     return x_session_id
 
 
-def dict_to_product(product_dict: Dict[str, Any]) -> ProductBase:
+@functools.lru_cache(maxsize=64)
+def _parse_retailers(retailers: str) -> Tuple[str, ...]:
     """
-    Convert a product dictionary from aggregated_search to a ProductBase model.
+    Parse and validate a comma-separated retailers query value.
+    
+    Memoized: clients send a handful of distinct combinations, so repeat values
+    skip the split/strip/lower pass. Invalid values raise and are not cached.
     
     Args:
-        product_dict: Dictionary containing product data from aggregated_search
-                     (now comes from ProductPublic.model_dump(), so includes both price and price_eur)
+        retailers: Comma-separated retailer identifiers as sent by the client
         
     Returns:
-        ProductBase model instance with all fields including is_cheapest and raw
+        Tuple of lower-cased retailer identifiers, de-duplicated in first-seen order
+        
+    Raises:
+        ValueError: If no retailers are given or any retailer is not supported
     """
-    # Extract price - prefer price_eur for backward compatibility, fallback to price
-    price_value = product_dict.get("price_eur") or product_dict.get("price") or 0.0
-    
-    return ProductBase(
-        id=str(product_dict.get("id", "")),
-        retailer=product_dict.get("retailer", ""),
-        name=product_dict.get("name", ""),
-        price=float(price_value),  # Use price field
-        price_eur=float(price_value),  # Also set price_eur alias
-        unit=product_dict.get("unit"),
-        unit_size=product_dict.get("unit_size"),
-        quantity=product_dict.get("quantity"),
-        quantity_unit=product_dict.get("quantity_unit"),
-        price_per_unit=product_dict.get("price_per_unit"),
-        image_url=product_dict.get("image_url"),
-        url=product_dict.get("url"),
-        health_tag=product_dict.get("health_tag", "neutral"),
-        is_cheapest=product_dict.get("is_cheapest"),
-        raw=product_dict.get("raw"),
-    )
+    # Duplicates dropped, first-seen order kept
+    retailer_list = tuple(dict.fromkeys(r for r in map(str.lower, map(str.strip, retailers.split(","))) if r))
+    if not retailer_list:
+        raise ValueError("At least one retailer must be specified. Valid retailers: ah, jumbo, picnic, dirk")
+    
+    invalid_retailers = set(retailer_list) - VALID_RETAILERS
+    if invalid_retailers:
+        raise ValueError(
+            f"Invalid retailer(s): {', '.join(sorted(invalid_retailers))}. Valid retailers: {VALID_RETAILERS_SORTED_STR}"
+        )
+    return retailer_list
+
+
+def _validate_search_params(
+    retailers: str,
+    sort_by: Optional[str],
+    health_filter: Optional[str],
+) -> Tuple[List[str], str, Optional[str]]:
+    """
+    Validate and normalize the /search query parameters in one place.
+    
+    Each value is lower-cased once and checked against the module-level
+    constant sets.
+    
+    Args:
+        retailers: Comma-separated retailer identifiers as sent by the client
+        sort_by: Sort criterion, or None/empty for the default ("price")
+        health_filter: Health tag filter, or None/empty for no filter
+        
+    Returns:
+        Tuple of (retailer_list, sort_by, health_filter) where retailer_list is
+        de-duplicated in first-seen order, sort_by is lower-cased and
+        health_filter is lower-cased or None
+        
+    Raises:
+        HTTPException 400: If no retailers are given or any value is invalid
+    """
+    try:
+        # Fresh list per request: the parsed tuple is shared through the parse cache
+        retailer_list = list(_parse_retailers(retailers))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        ) from e
+    
+    # Accept both legacy and new sort_by formats
+    sort_by_lower = sort_by.lower() if sort_by else "price"
+    if sort_by_lower not in VALID_SORT_OPTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid sort_by: '{sort_by}'. Valid options: {VALID_SORT_OPTIONS_SORTED_STR}"
+        )
+    
+    health_filter_lower = health_filter.lower() if health_filter else None
+    if health_filter_lower is not None and health_filter_lower not in VALID_HEALTH_FILTERS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid health_filter: '{health_filter}'. Valid options: 'healthy', 'unhealthy'"
+        )
+    
+    return retailer_list, sort_by_lower, health_filter_lower
 
 
 @app.get(
@@ -180,7 +274,8 @@ def dict_to_product(product_dict: Dict[str, Any]) -> ProductBase:
     description="Search for products across Albert Heijn, Jumbo, Picnic, and Dirk. Results are normalized, "
                 "health-tagged, grouped by name with cheapest marked, and sorted according to sort_by parameter.",
 )
-def search(
+async def search(
+    background_tasks: BackgroundTasks,
     q: str = Query(..., min_length=1, description="Search query string (e.g., 'melk', 'brood')"),
     retailers: str = Query(
         "picnic,ah,jumbo",
@@ -215,6 +310,7 @@ def search(
         sort_by: Sort criterion - "price"/"price_asc", "price_desc", "price_per_unit_asc", 
                 "price_per_unit_desc", "retailer", or "health" (default: "price")
         health_filter: Optional filter for health tag - "healthy" or "unhealthy"
+        background_tasks: Runs the event log write after the response is sent
         
     Returns:
         SearchResponse containing:
@@ -229,53 +325,18 @@ def search(
         GET /search?q=melk&retailers=ah,picnic&size=5&sort_by=price&health_filter=healthy
         ```
     """
-    # Parse and validate retailers
-    retailer_list = [r.strip().lower() for r in retailers.split(",") if r.strip()]
-    
-    if not retailer_list:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="At least one retailer must be specified. Valid retailers: ah, jumbo, picnic, dirk"
-        )
-    
-    # Validate retailer names
-    invalid_retailers = [r for r in retailer_list if r not in VALID_RETAILERS]
-    if invalid_retailers:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid retailer(s): {', '.join(invalid_retailers)}. Valid retailers: {', '.join(sorted(VALID_RETAILERS))}"
-        )
-    
-    # Validate sort_by parameter (accept both legacy and new format)
-    valid_sort_options = {
-        "price", "price_asc", "price_desc",
-        "price_per_unit", "price_per_unit_asc", "price_per_unit_desc",
-        "retailer", "health"
-    }
-    if sort_by and sort_by.lower() not in valid_sort_options:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid sort_by: '{sort_by}'. Valid options: {', '.join(sorted(valid_sort_options))}"
-        )
-    
-    # Validate health_filter if provided
-    if health_filter:
-        health_filter_lower = health_filter.lower()
-        if health_filter_lower not in ("healthy", "unhealthy"):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid health_filter: '{health_filter}'. Valid options: 'healthy', 'unhealthy'"
-            )
+    retailer_list, sort_by, health_filter = _validate_search_params(retailers, sort_by, health_filter)
     
     try:
-        # Perform aggregated search with all parameters
+        # Perform aggregated search with all parameters. Cache hits are served on the
+        # event loop; retailer fetches run on a worker thread (the SDKs are blocking).
         # Note: query and retailers are positional args to match test expectations
-        search_response = aggregated_search(
+        search_response = await aggregated_search_async(
             q,  # positional: query
             retailer_list,  # positional: retailers
             size_per_retailer=size,
             page=page,
-            sort_by=sort_by or "price",
+            sort_by=sort_by,
             health_filter=health_filter
         )
         
@@ -283,19 +344,19 @@ def search(
         results_dicts = search_response.get("results", [])
         connectors_status = search_response.get("connectors_status", {})
         
-        # Convert dictionaries to ProductBase models
-        products = [dict_to_product(p) for p in results_dicts]
-        
-        # Log search event (non-blocking)
+        # Log search event after the response is sent (the event log writes to file/DB)
         # Session ID: use header if available (client.host fallback would require Request injection)
-        log_search_performed(
+        background_tasks.add_task(
+            log_search_performed,
             session_id=x_session_id,
             query=q,
             retailer_codes=retailer_list,
-            result_count=len(products),
+            result_count=len(results_dicts),
         )
         
-        return SearchResponse(results=products, connectors_status=connectors_status)
+        # Return the result dicts as-is: FastAPI validates them against SearchResponse
+        # once and serializes straight to JSON (no intermediate ProductBase objects)
+        return {"results": results_dicts, "connectors_status": connectors_status}
     except RuntimeError as e:
         # Handle connector errors specifically
         raise HTTPException(
@@ -310,6 +371,88 @@ def search(
         ) from e
 
 
+_STREAM_BATCH_ADAPTER = TypeAdapter(SearchStreamBatch)
+
+
+@app.get(
+    "/search/stream",
+    tags=["search"],
+    summary="Stream search results per retailer as they arrive",
+    description="Same parameters as /search, but results are streamed as newline-delimited JSON, one line "
+                "per retailer as soon as that retailer answers. Cheapest flags are only set when the "
+                "search is served from cache.",
+)
+def search_stream(
+    background_tasks: BackgroundTasks,
+    q: str = Query(..., min_length=1, description="Search query string (e.g., 'melk', 'brood')"),
+    retailers: str = Query(
+        "picnic,ah,jumbo",
+        description="Comma-separated list of retailers to search. Valid values: ah, jumbo, picnic, dirk"
+    ),
+    size: int = Query(10, ge=1, le=50, description="Number of results per retailer (max: 50)"),
+    page: int = Query(0, ge=0, description="Page number (0-indexed)"),
+    sort_by: Optional[str] = Query("price", description="Sort criterion within each retailer batch (see /search)"),
+    health_filter: Optional[str] = Query(
+        None,
+        description="Filter by health tag: 'healthy' or 'unhealthy' (optional)"
+    ),
+    x_session_id: Optional[str] = Header(None, alias="X-Session-ID", description="Session identifier (optional)"),
+) -> StreamingResponse:
+    """
+    Stream search results retailer by retailer.
+    
+    Time to first byte is the fastest retailer's latency instead of the slowest one's,
+    which matters on slow mobile connections. Shares the /search cache: a cached search
+    is replayed per retailer, and a completed stream fills the cache for /search. Use
+    /search for a single, fully sorted list with cheapest flags.
+    
+    Args:
+        q: Search query string (minimum 1 character)
+        retailers: Comma-separated list of retailer identifiers (e.g., "ah,jumbo,picnic")
+        size: Number of results to return per retailer (1-50)
+        page: Page number for pagination (0-indexed)
+        sort_by: Sort criterion applied within each retailer's batch (default: "price")
+        health_filter: Optional filter for health tag - "healthy" or "unhealthy"
+        background_tasks: Logs the search event once the stream has finished
+        
+    Returns:
+        StreamingResponse of application/x-ndjson. Each line is a SearchStreamBatch:
+        retailer, status and results (same product format as /search).
+        
+    Raises:
+        HTTPException 400: If no valid retailers are specified or parameters are invalid
+        
+    Example:
+        ```bash
+        GET /search/stream?q=melk&retailers=ah,jumbo,picnic
+        ```
+    """
+    retailer_list, sort_by, health_filter = _validate_search_params(retailers, sort_by, health_filter)
+    
+    result_count = 0
+    
+    def ndjson_lines():
+        nonlocal result_count
+        for batch in iter_search_batches(
+            q, retailer_list, size_per_retailer=size, page=page, sort_by=sort_by, health_filter=health_filter,
+        ):
+            result_count += len(batch["results"])
+            # Validate against the public schema so internal product fields are dropped
+            yield _STREAM_BATCH_ADAPTER.dump_json(_STREAM_BATCH_ADAPTER.validate_python(batch)) + b"\n"
+    
+    def log_stream_search() -> None:
+        # Background tasks run after the body is sent, so the count covers every batch
+        log_search_performed(
+            session_id=x_session_id,
+            query=q,
+            retailer_codes=retailer_list,
+            result_count=result_count,
+        )
+    
+    background_tasks.add_task(log_stream_search)
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @app.post(
     "/cart/add",
     response_model=CartView,
@@ -320,6 +463,7 @@ def search(
 )
 def add_item(
     item: CartItemInput,
+    background_tasks: BackgroundTasks,
     x_session_id: Optional[str] = Header(None, alias="X-Session-ID", description="Session identifier (required)"),
 ) -> CartView:
     """
@@ -331,6 +475,7 @@ def add_item(
     Args:
         item: CartItemInput model containing cart item data
         x_session_id: Session ID from X-Session-ID header (optional, defaults to "demo-user")
+        background_tasks: Runs the event log write after the response is sent
         
     Returns:
         CartView containing:
@@ -355,56 +500,32 @@ def add_item(
         ```
     """
     # Validate retailer
-    if item.retailer.lower() not in VALID_RETAILERS:
+    retailer_lower = item.retailer.lower()
+    if retailer_lower not in VALID_RETAILERS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid retailer: {item.retailer}. Valid retailers: {', '.join(sorted(VALID_RETAILERS))}"
+            detail=f"Invalid retailer: {item.retailer}. Valid retailers: {VALID_RETAILERS_SORTED_STR}"
         )
     
     session = get_session(x_session_id)
     
     try:
-        # Convert CartItemInput to CartItem and add to cart
-        cart_item = CartItem(
-            retailer=item.retailer.lower(),
-            product_id=item.product_id,
-            name=item.name,
-            price_eur=item.price_eur,
-            quantity=item.quantity,
-            image_url=item.image_url,
-            health_tag=item.health_tag,
-        )
-        
-        cart = add_to_cart(session, cart_item.model_dump())
+        # CartItemInput has already validated every CartItem field with the same
+        # constraints, so build the CartItem without validating it a second time
+        cart_item = CartItem.model_construct(**{**item.model_dump(), "retailer": retailer_lower})
+        cart = add_to_cart(session, cart_item)
         
-        # Log cart item addition event (non-blocking)
-        log_cart_items_added(
+        # Log cart item addition event after the response is sent
+        background_tasks.add_task(
+            log_cart_items_added,
             session_id=session,
             retailer=cart_item.retailer,
             count=cart_item.quantity,
             item_ids=[cart_item.product_id],
         )
         
-        # Convert Cart to CartView format with CartItemOut (includes line_total)
-        items_out = [
-            CartItemOut(
-                retailer=item.retailer,
-                product_id=item.product_id,
-                name=item.name,
-                price_eur=item.price_eur,
-                quantity=item.quantity,
-                image_url=item.image_url,
-                health_tag=item.health_tag,
-                line_total=item.total_price
-            )
-            for item in cart.items.values()
-        ]
-        
-        return CartView(
-            items=items_out,
-            total_price=cart.total(),
-            total_by_retailer=cart.total_by_retailer()
-        )
+        # Single pass over the cart; FastAPI validates the dict against CartView once
+        return cart.to_view_dict()
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -426,6 +547,7 @@ def add_item(
                 "exceeds the item's quantity, the item is completely removed.",
 )
 def remove_item(
+    background_tasks: BackgroundTasks,
     retailer: str = Query(..., description="Retailer identifier (ah, jumbo, picnic, or dirk)"),
     product_id: str = Query(..., min_length=1, description="Product identifier"),
     qty: int = Query(1, ge=1, description="Quantity to remove (default: 1)"),
@@ -442,6 +564,7 @@ def remove_item(
         product_id: Product identifier (minimum 1 character)
         qty: Quantity to remove (default: 1, minimum: 1)
         x_session_id: Session ID from X-Session-ID header (optional, defaults to "demo-user")
+        background_tasks: Runs the event log write after the response is sent
         
     Returns:
         CartView containing:
@@ -463,7 +586,7 @@ def remove_item(
     if retailer_lower not in VALID_RETAILERS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid retailer: {retailer}. Valid retailers: {', '.join(sorted(VALID_RETAILERS))}"
+            detail=f"Invalid retailer: {retailer}. Valid retailers: {VALID_RETAILERS_SORTED_STR}"
         )
     
     session = get_session(x_session_id)
@@ -471,34 +594,17 @@ def remove_item(
     try:
         cart = remove_from_cart(session, retailer_lower, product_id, qty)
         
-        # Log cart item removal event (non-blocking)
-        log_cart_items_removed(
+        # Log cart item removal event after the response is sent
+        background_tasks.add_task(
+            log_cart_items_removed,
             session_id=session,
             retailer=retailer_lower,
             count=qty,
             item_ids=[product_id],
         )
         
-        # Convert Cart to CartView format with CartItemOut (includes line_total)
-        items_out = [
-            CartItemOut(
-                retailer=item.retailer,
-                product_id=item.product_id,
-                name=item.name,
-                price_eur=item.price_eur,
-                quantity=item.quantity,
-                image_url=item.image_url,
-                health_tag=item.health_tag,
-                line_total=item.total_price
-            )
-            for item in cart.items.values()
-        ]
-        
-        return CartView(
-            items=items_out,
-            total_price=cart.total(),
-            total_by_retailer=cart.total_by_retailer()
-        )
+        # Single pass over the cart; FastAPI validates the dict against CartView once
+        return cart.to_view_dict()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -543,26 +649,8 @@ def view_cart(
     try:
         cart = get_cart(session)
         
-        # Convert Cart to CartView format with CartItemOut (includes line_total)
-        items_out = [
-            CartItemOut(
-                retailer=item.retailer,
-                product_id=item.product_id,
-                name=item.name,
-                price_eur=item.price_eur,
-                quantity=item.quantity,
-                image_url=item.image_url,
-                health_tag=item.health_tag,
-                line_total=item.total_price
-            )
-            for item in cart.items.values()
-        ]
-        
-        return CartView(
-            items=items_out,
-            total_price=cart.total(),
-            total_by_retailer=cart.total_by_retailer()
-        )
+        # Single pass over the cart; FastAPI validates the dict against CartView once
+        return cart.to_view_dict()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -570,6 +658,25 @@ def view_cart(
         ) from e
 
 
+# Retailers whose connectors provide delivery slots (others always return an empty list)
+DELIVERY_SLOT_RETAILERS = frozenset({"picnic", "ah", "jumbo"})
+
+
+def _fetch_delivery_slots(retailer: str) -> List[dict]:
+    """Fetch delivery slots for a validated retailer (blocking; run off the event loop)."""
+    if retailer not in DELIVERY_SLOT_RETAILERS:
+        return []
+    # Shared with /search: one long-lived connector per retailer (Picnic logs in once)
+    connector = get_connector(retailer)
+    try:
+        # Connectors always return a list (see BaseConnector.get_delivery_slots)
+        return connector.get_delivery_slots()
+    except PicnicAuthError:
+        # Session expired or revoked: log in again on the next request
+        reset_connector(retailer)
+        raise
+
+
 @app.get(
     "/delivery/slots",
     tags=["delivery"],
@@ -578,7 +685,7 @@ def view_cart(
                 "Currently only Picnic supports delivery slots.",
     response_model=List[dict],
 )
-def get_slots(
+async def get_slots(
     retailer: str = Query("picnic", description="Retailer identifier (ah, jumbo, picnic, or dirk)"),
 ) -> Any:
     """
@@ -608,24 +715,12 @@ def get_slots(
     if retailer_lower not in VALID_RETAILERS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid retailer: {retailer}. Valid retailers: {', '.join(sorted(VALID_RETAILERS))}"
+            detail=f"Invalid retailer: {retailer}. Valid retailers: {VALID_RETAILERS_SORTED_STR}"
         )
     
     try:
-        if retailer_lower == "picnic":
-            connector = PicnicConnector()
-            slots = connector.get_delivery_slots()
-            return slots if isinstance(slots, list) else []
-        elif retailer_lower == "ah":
-            connector = AHConnector()
-            slots = connector.get_delivery_slots()
-            return slots if isinstance(slots, list) else []
-        elif retailer_lower == "jumbo":
-            connector = JumboConnector()
-            slots = connector.get_delivery_slots()
-            return slots if isinstance(slots, list) else []
-        else:
-            return []
+        # Connector setup (e.g. Picnic login) and slot lookup are blocking I/O
+        return await asyncio.to_thread(_fetch_delivery_slots, retailer_lower)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -642,6 +737,7 @@ def get_slots(
                 "calculating potential savings. Uses aggregated_search to find alternatives.",
 )
 def get_basket_savings(
+    background_tasks: BackgroundTasks,
     x_session_id: Optional[str] = Header(None, alias="X-Session-ID", description="Session identifier (required)"),
 ) -> BasketSavingsResponse:
     """
@@ -655,6 +751,7 @@ def get_basket_savings(
     
     Args:
         x_session_id: Session ID from X-Session-ID header (required)
+        background_tasks: Runs the event log write after the response is sent
         
     Returns:
         BasketSavingsResponse containing:
@@ -685,9 +782,8 @@ def get_basket_savings(
             )
         
         # Convert cart items to dict format for savings analysis
-        basket_items = []
-        for item in cart.items.values():
-            item_dict = {
+        basket_items = [
+            {
                 "retailer": item.retailer,
                 "product_id": item.product_id,
                 "name": item.name,
@@ -700,11 +796,10 @@ def get_basket_savings(
                 # but savings logic will handle None gracefully
                 "price_per_unit": None,  # Cart items don't store this, but search results will have it
             }
-            basket_items.append(item_dict)
+            for item in cart.items.values()
+        ]
         
         # Call savings finder
-        from aggregator.savings import find_basket_savings
-        
         savings_result = find_basket_savings(
             basket_items=basket_items,
             search_fn=aggregated_search,
@@ -748,8 +843,9 @@ def get_basket_savings(
             suggestions=suggestions
         )
         
-        # Log savings analysis event (non-blocking, already handled in log_event)
-        log_event(
+        # Log savings analysis event after the response is sent
+        background_tasks.add_task(
+            log_event,
             "savings_analysis_run",
             session_id=session,
             payload={
@@ -771,6 +867,44 @@ def get_basket_savings(
         ) from e
 
 
+def _to_template_item(item: Dict[str, Any]) -> BasketTemplateItem:
+    """
+    Build a BasketTemplateItem from a stored template item dict.
+    
+    Template items are written from validated cart items, so the model is built with
+    model_construct() instead of being validated again field by field.
+    
+    Args:
+        item: Template item dict as stored by aggregator.templates
+        
+    Returns:
+        BasketTemplateItem; line_total falls back to price_eur * quantity when missing
+    """
+    get = item.get
+    price_eur = float(get("price_eur", 0.0))
+    quantity = int(get("quantity", 1))
+    return BasketTemplateItem.model_construct(
+        retailer=get("retailer", ""),
+        product_id=str(get("product_id", "")),
+        name=get("name", ""),
+        price_eur=price_eur,
+        quantity=quantity,
+        line_total=get("line_total") or price_eur * quantity,
+        health_tag=get("health_tag"),
+        image_url=get("image_url"),
+    )
+
+
+def _to_basket_template(template: SavedBasketTemplate) -> BasketTemplate:
+    """Build the BasketTemplate response model for a saved template."""
+    return BasketTemplate(
+        id=template.id,
+        name=template.name,
+        created_at=template.created_at,
+        items=[_to_template_item(item) for item in template.items],
+    )
+
+
 @app.get(
     "/api/basket/templates",
     response_model=BasketTemplateListResponse,
@@ -785,35 +919,7 @@ def list_basket_templates(
     session = get_session(x_session_id)
     templates = list_templates_for_session(session)
     
-    # Convert to Pydantic models
-    pydantic_templates = []
-    for t in templates:
-        template_items = []
-        for item in t.items:
-            line_total = item.get("line_total") or (float(item.get("price_eur", 0.0)) * int(item.get("quantity", 1)))
-            from api.schemas import BasketTemplateItem
-            template_items.append(
-                BasketTemplateItem(
-                    retailer=item.get("retailer", ""),
-                    product_id=str(item.get("product_id", "")),
-                    name=item.get("name", ""),
-                    price_eur=float(item.get("price_eur", 0.0)),
-                    quantity=int(item.get("quantity", 1)),
-                    line_total=line_total,
-                    health_tag=item.get("health_tag"),
-                    image_url=item.get("image_url"),
-                )
-            )
-        pydantic_templates.append(
-            BasketTemplate(
-                id=t.id,
-                name=t.name,
-                created_at=t.created_at,
-                items=template_items,
-            )
-        )
-    
-    return BasketTemplateListResponse(templates=pydantic_templates)
+    return BasketTemplateListResponse(templates=[_to_basket_template(t) for t in templates])
 
 
 @app.post(
@@ -824,6 +930,7 @@ def list_basket_templates(
     description="Save the current basket contents as a named template for reuse.",
 )
 def save_basket_template(
+    background_tasks: BackgroundTasks,
     payload: SaveBasketTemplateRequest,
     x_session_id: Optional[str] = Header(None, alias="X-Session-ID", description="Session identifier (required)"),
 ) -> SaveBasketTemplateResponse:
@@ -838,9 +945,8 @@ def save_basket_template(
         )
     
     # Convert cart items to dict format
-    items = []
-    for item in cart.items.values():
-        items.append({
+    items = [
+        {
             "retailer": item.retailer,
             "product_id": item.product_id,
             "name": item.name,
@@ -849,49 +955,27 @@ def save_basket_template(
             "line_total": item.total_price,
             "image_url": item.image_url,
             "health_tag": item.health_tag,
-        })
+        }
+        for item in cart.items.values()
+    ]
     
     # Save template
     template = save_template_for_session(session, payload.name, items)
     
-    # Convert to Pydantic model
-    template_items = []
-    for item in template.items:
-        from api.schemas import BasketTemplateItem
-        template_items.append(
-            BasketTemplateItem(
-                retailer=item.get("retailer", ""),
-                product_id=str(item.get("product_id", "")),
-                name=item.get("name", ""),
-                price_eur=float(item.get("price_eur", 0.0)),
-                quantity=int(item.get("quantity", 1)),
-                line_total=item.get("line_total"),
-                health_tag=item.get("health_tag"),
-                image_url=item.get("image_url"),
-            )
-        )
+    p_template = _to_basket_template(template)
     
-    p_template = BasketTemplate(
-        id=template.id,
-        name=template.name,
-        created_at=template.created_at,
-        items=template_items,
+    # Log template save event after the response is sent
+    background_tasks.add_task(
+        log_event,
+        "template_saved",
+        session_id=session,
+        payload={
+            "template_name": template.name,
+            "template_id": template.id,
+            "item_count": len(template.items),
+        },
     )
     
-    # Log template save event
-    try:
-        log_event(
-            "template_saved",
-            session_id=session,
-            payload={
-                "template_name": template.name,
-                "template_id": template.id,
-                "item_count": len(template.items),
-            },
-        )
-    except Exception:
-        pass  # Non-blocking
-    
     return SaveBasketTemplateResponse(template=p_template)
 
 
@@ -903,6 +987,7 @@ def save_basket_template(
     description="Replace the current basket contents with a saved template.",
 )
 def apply_basket_template(
+    background_tasks: BackgroundTasks,
     template_id: str,
     x_session_id: Optional[str] = Header(None, alias="X-Session-ID", description="Session identifier (required)"),
 ) -> BasketTemplate:
@@ -919,56 +1004,33 @@ def apply_basket_template(
     cart_before = get_cart(session)
     previous_count = len(cart_before.items)
     
-    # Replace cart with template items (this clears and replaces)
-    replace_cart(session, template.items)
+    # Replace cart with template items (this clears and replaces); the new cart is
+    # returned, so it is not fetched again for the event payload
+    cart_after = replace_cart(session, template.items)
     
-    # Log cart cleared if there were items before
+    # Log cart cleared if there were items before (events are written after the response is sent)
     if previous_count > 0:
-        log_cart_cleared(
+        background_tasks.add_task(
+            log_cart_cleared,
             session_id=session,
             previous_count=previous_count,
         )
     
-    # Log template applied event
-    try:
-        cart_after = get_cart(session)
-        log_event(
-            "template_applied",
-            session_id=session,
-            payload={
-                "template_name": template.name,
-                "template_id": template.id,
-                "item_count": len(template.items),
-                "basket_total_items": len(cart_after.items),
-                "basket_total_value": cart_after.total(),
-            },
-        )
-    except Exception:
-        pass  # Non-blocking
-    
-    # Convert to Pydantic model
-    template_items = []
-    for item in template.items:
-        from api.schemas import BasketTemplateItem
-        template_items.append(
-            BasketTemplateItem(
-                retailer=item.get("retailer", ""),
-                product_id=str(item.get("product_id", "")),
-                name=item.get("name", ""),
-                price_eur=float(item.get("price_eur", 0.0)),
-                quantity=int(item.get("quantity", 1)),
-                line_total=item.get("line_total"),
-                health_tag=item.get("health_tag"),
-                image_url=item.get("image_url"),
-            )
-        )
-    
-    return BasketTemplate(
-        id=template.id,
-        name=template.name,
-        created_at=template.created_at,
-        items=template_items,
+    # Log template applied event; the payload is taken now, while it reflects this request
+    background_tasks.add_task(
+        log_event,
+        "template_applied",
+        session_id=session,
+        payload={
+            "template_name": template.name,
+            "template_id": template.id,
+            "item_count": len(template.items),
+            "basket_total_items": len(cart_after.items),
+            "basket_total_value": cart_after.total(),
+        },
     )
+    
+    return _to_basket_template(template)
 
 
 @app.delete(
@@ -989,7 +1051,7 @@ def delete_basket_template(
 
 
 @app.get("/health", tags=["health"])
-def health():
+async def health() -> Dict[str, Any]:
     """
     Health check endpoint for monitoring and status checks.
     
@@ -999,27 +1061,57 @@ def health():
     """
     uptime_seconds = int(time.time() - _APP_START_TIME)
     
-    # Check database status
-    db_enabled = False
-    try:
-        from aggregator.db import db_is_enabled
-        db_enabled = db_is_enabled()
-    except Exception:
-        # If db_is_enabled() raises any error, treat as fallback mode
-        db_enabled = False
-    
     return {
         "status": "ok",
         "name": "NL Grocery Aggregator API",
         "version": "1.0.0",
         "description": "Backend API for aggregating grocery products from Albert Heijn, Jumbo, Picnic, and Dirk",
         "uptime_seconds": uptime_seconds,
-        "db_enabled": db_enabled,
+        # Flag checks only (no connection attempt), cheap enough to evaluate per probe
+        "db_enabled": db_is_enabled(),
     }
 
 
+def require_admin_token(x_admin_token: Optional[str] = Header(None, alias="X-Admin-Token")) -> None:
+    """
+    Check the X-Admin-Token header against the ADMIN_TOKEN environment variable.
+    
+    Args:
+        x_admin_token: Token from the X-Admin-Token header
+        
+    Raises:
+        HTTPException 404: If ADMIN_TOKEN is not set (admin endpoints are disabled)
+        HTTPException 403: If the header is missing or does not match
+    """
+    admin_token = api.config.get_admin_token()
+    if admin_token is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token.encode(), admin_token.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin token.")
+
+
+@app.post("/admin/cache/clear", tags=["health"], dependencies=[Depends(require_admin_token)])
+def clear_search_cache() -> Dict[str, Any]:
+    """
+    Drop all cached search results (in-memory, and Redis when REDIS_URL is set).
+    
+    For operations use, e.g. after a retailer price update, so the next searches
+    go to the connectors instead of waiting for the cache TTL to expire. Clearing
+    forces fresh (paid) retailer calls, so the endpoint is only available when
+    ADMIN_TOKEN is set, to requests sending it in X-Admin-Token.
+    
+    Returns:
+        Dictionary with status and the number of entries cleared (in-memory and Redis)
+        
+    Raises:
+        HTTPException 404: If ADMIN_TOKEN is not set
+        HTTPException 403: If X-Admin-Token is missing or wrong
+    """
+    return {"status": "ok", "cleared": clear_cache()}
+
+
 @app.get("/price-history/{retailer}/{product_id}", tags=["search"])
-def price_history(retailer: str, product_id: str, limit: int = Query(30, ge=1, le=100)):
+def price_history(retailer: str, product_id: str, limit: int = Query(30, ge=1, le=100)) -> Dict[str, Any]:
     """
     Demo price history endpoint.
     
@@ -1118,26 +1210,7 @@ def apply_swap(
     try:
         cart = get_cart(session)
         
-        # Convert Cart to CartView format
-        items_out = [
-            CartItemOut(
-                retailer=item.retailer,
-                product_id=item.product_id,
-                name=item.name,
-                price_eur=item.price_eur,
-                quantity=item.quantity,
-                image_url=item.image_url,
-                health_tag=item.health_tag,
-                line_total=item.total_price
-            )
-            for item in cart.items.values()
-        ]
-        
-        return CartView(
-            items=items_out,
-            total_price=cart.total(),
-            total_by_retailer=cart.total_by_retailer()
-        )
+        return cart.to_view_dict()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1145,17 +1218,39 @@ def apply_swap(
         ) from e
 
 
-@app.get("/")
-def root():
+# The root payload never changes while the process runs, so its ETag is computed once
+_ROOT_INFO: Dict[str, Any] = {
+    "name": "NL Grocery Aggregator API",
+    "version": "1.0.0",
+    "description": "Backend API for aggregating grocery products from Albert Heijn, Jumbo, Picnic, and Dirk",
+    "docs": "/docs" if _DOCS_ENABLED else None,
+}
+_ROOT_ETAG = '"' + hashlib.sha1(json.dumps(_ROOT_INFO, sort_keys=True).encode()).hexdigest()[:16] + '"'
+
+
+@app.get("/", response_model=None)
+async def root(request: Request, response: Response) -> Union[Dict[str, Any], Response]:
     """
     Root endpoint providing API information.
     
+    Sends an ETag; a request whose If-None-Match matches it gets an empty
+    304 Not Modified instead of the body.
+    
     Returns:
-        Dictionary with API name and version
+        Dictionary with API name and version, or a 304 response
     """
-    return {
-        "name": "NL Grocery Aggregator API",
-        "version": "1.0.0",
-        "description": "Backend API for aggregating grocery products from Albert Heijn, Jumbo, Picnic, and Dirk",
-        "docs": "/docs",
-    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or _ROOT_ETAG in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": _ROOT_ETAG})
+    
+    response.headers["ETag"] = _ROOT_ETAG
+    return _ROOT_INFO
+
+
+# Build the OpenAPI schema now that every route is registered. FastAPI keeps it on
+# app.openapi_schema, so the first /docs visitor does not pay for walking the schemas.
+if _DOCS_ENABLED:
+    app.openapi()
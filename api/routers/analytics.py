@@ -11,7 +11,8 @@ or encounters errors, returning empty data rather than raising exceptions.
 
 import json
 import logging
-from typing import Any, Dict
+from datetime import datetime
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Query
 
@@ -22,6 +23,25 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 
+def _decode_payload(payload: Optional[str]) -> Dict[str, Any]:
+    """
+    Decode a stored event payload.
+    
+    Args:
+        payload: JSON text from the events table, or None
+        
+    Returns:
+        Decoded payload, {} when empty, or {"raw": payload} if it is not valid JSON
+    """
+    if not payload:
+        return {}
+    try:
+        return json.loads(payload) or {}
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Failed to parse event payload as JSON: {e}")
+        return {"raw": payload}
+
+
 @router.get(
     "/events/recent",
     summary="Get recent events",
@@ -72,22 +92,17 @@ def get_recent_events(
         events = db_get_recent_events(limit=limit)
         
         # Convert EventRow objects to dictionaries
-        events_list = []
-        for event in events:
-            payload_dict = None
-            if event.payload:
-                try:
-                    payload_dict = json.loads(event.payload)
-                except Exception as e:
-                    logger.debug(f"Failed to parse event payload as JSON: {e}")
-                    payload_dict = {"raw": event.payload}
-            
-            events_list.append({
-                "ts": event.ts.isoformat() if hasattr(event.ts, "isoformat") else str(event.ts),
+        events_list = [
+            {
+                # Datetimes are left to FastAPI's pydantic-core serializer, which writes
+                # the same ISO 8601 string as isoformat() for these naive UTC timestamps
+                "ts": event.ts if isinstance(event.ts, datetime) else str(event.ts),
                 "event_type": event.event_type,
                 "session_id": event.session_id,
-                "payload": payload_dict or {},
-            })
+                "payload": _decode_payload(event.payload),
+            }
+            for event in events
+        ]
         
         return {
             "db_enabled": True,
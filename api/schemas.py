@@ -108,6 +108,17 @@ class SearchResponse(BaseModel):
     )
 
 
+class SearchStreamBatch(BaseModel):
+    """
+    One line of the /search/stream response: a single retailer's results.
+    
+    Products use the same ProductBase format as /search, so internal fields are not exposed.
+    """
+    retailer: str = Field(..., description="Retailer identifier (e.g., 'ah', 'jumbo')")
+    status: str = Field(..., description="Connector status: 'ok', 'auth_error', 'disabled' or 'error'")
+    results: List[ProductBase] = Field(..., description="This retailer's products, sorted within the batch")
+
+
 class CartItemInput(BaseModel):
     """
     Input model for adding an item to the shopping cart.
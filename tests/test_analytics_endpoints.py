@@ -188,3 +188,30 @@ def test_analytics_event_counts_response_structure():
             assert isinstance(count, int)
             assert count >= 0
 
+
+
+def test_analytics_recent_events_serializes_timestamps_as_iso_strings():
+    """
+    Test that event timestamps come back as datetime.isoformat() strings and payloads are decoded.
+    """
+    from datetime import datetime
+    from types import SimpleNamespace
+    from unittest.mock import patch
+    
+    rows = [
+        SimpleNamespace(ts=datetime(2024, 1, 15, 10, 30, 0, 123456), event_type="search_performed",
+                        session_id="abc123", payload='{"query": "melk"}'),
+        SimpleNamespace(ts=datetime(2024, 1, 15, 10, 29), event_type="cart_cleared",
+                        session_id=None, payload=None),
+        SimpleNamespace(ts=datetime(2024, 1, 15, 10, 28), event_type="legacy",
+                        session_id=None, payload="not json"),
+    ]
+    with patch("api.routers.analytics.db_is_enabled", return_value=True), \
+         patch("api.routers.analytics.db_get_recent_events", return_value=rows):
+        data = client.get("/analytics/events/recent?limit=3").json()
+    
+    assert data["db_enabled"] is True
+    assert [e["ts"] for e in data["events"]] == [row.ts.isoformat() for row in rows]
+    assert data["events"][0]["payload"] == {"query": "melk"}
+    assert data["events"][1]["payload"] == {}
+    assert data["events"][2]["payload"] == {"raw": "not json"}
@@ -249,6 +249,20 @@ class TestCart:
         # Total: (1.99 * 2) + (2.50 * 3) + (3.00 * 1) = 3.98 + 7.50 + 3.00 = 14.48
         assert cart.total() == pytest.approx(14.48, rel=1e-2)
     
+    def test_cart_to_view_dict_matches_totals(self):
+        """Test that the single-pass cart view agrees with total() and total_by_retailer()."""
+        cart = Cart()
+        cart.add(CartItem(retailer="ah", product_id="1", name="Melk", price_eur=1.99, quantity=2))
+        cart.add(CartItem(retailer="jumbo", product_id="2", name="Brood", price_eur=2.50, quantity=1))
+        cart.add(CartItem(retailer="ah", product_id="3", name="Kaas", price_eur=4.10, quantity=1))
+        
+        view = cart.to_view_dict()
+        
+        assert [line["product_id"] for line in view["items"]] == ["1", "2", "3"]
+        assert view["items"][0]["line_total"] == pytest.approx(3.98)
+        assert view["total_price"] == cart.total()
+        assert view["total_by_retailer"] == cart.total_by_retailer()
+    
     def test_cart_total_empty_cart(self):
         """Test that empty cart returns zero total."""
         cart = Cart()
@@ -302,3 +316,18 @@ class TestCart:
         assert "ah:123" in cart.items
         assert "ah:123" == f"{item.retailer}:{item.product_id}"
 
+    
+    def test_add_to_cart_accepts_cart_item(self):
+        """Test that add_to_cart stores a ready-made CartItem and still accepts dicts."""
+        from aggregator.cart import CART_STORE, add_to_cart
+        
+        session_id = "test-add-cart-item"
+        CART_STORE.pop(session_id, None)
+        item = CartItem(retailer="ah", product_id="123", name="Test Product", price_eur=1.99)
+        
+        cart = add_to_cart(session_id, item)
+        assert cart.items["ah:123"] is item
+        
+        cart = add_to_cart(session_id, {"retailer": "ah", "product_id": "123", "name": "Test Product", "price_eur": 1.99})
+        assert cart.items["ah:123"].quantity == 2
+        CART_STORE.pop(session_id, None)
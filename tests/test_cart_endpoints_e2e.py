@@ -274,3 +274,62 @@ class TestCartEndpointsE2E:
         assert isinstance(data["total_by_retailer"], dict)
         assert len(data["total_by_retailer"]) == 0
 
+    
+    def test_add_item_logs_event_in_background(self, client):
+        """Test that POST /cart/add hands the event log write to a background task."""
+        from unittest.mock import patch
+        
+        item_data = {"retailer": "ah", "product_id": "bg-1", "name": "Test Bread", "price_eur": 2.49, "quantity": 1}
+        
+        with patch("api.main.log_cart_items_added") as mock_log:
+            response = client.post("/cart/add", json=item_data, headers={"X-Session-ID": "test-bg-log"})
+        
+        assert response.status_code == 200
+        mock_log.assert_called_once_with(
+            session_id="test-bg-log", retailer="ah", count=1, item_ids=["bg-1"],
+        )
+    
+    def test_basket_savings_with_items(self, client):
+        """Test that GET /basket/savings builds suggestions for a non-empty basket."""
+        from unittest.mock import patch
+        
+        session_id = "test-savings-items"
+        client.post(
+            "/cart/add",
+            json={"retailer": "ah", "product_id": "sv-1", "name": "Melk", "price_eur": 2.00, "quantity": 2},
+            headers={"X-Session-ID": session_id},
+        )
+        search_results = {"results": [
+            {"id": "jumbo:sv-2", "name": "Melk", "retailer": "jumbo", "price": 1.50, "health_tag": "neutral"},
+        ]}
+        
+        with patch("api.main.aggregated_search", return_value=search_results):
+            response = client.get("/basket/savings", headers={"X-Session-ID": session_id})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["potential_savings_total"] == 1.0
+        assert data["suggestions"][0]["alternative"]["retailer"] == "jumbo"
+    
+    def test_basket_savings_skips_malformed_items(self):
+        """Test that one malformed basket item is skipped instead of failing the whole savings pass."""
+        from aggregator.savings import find_basket_savings
+        
+        basket = [
+            {"retailer": "ah", "product_id": "bad-1", "name": "Kaas", "price_eur": "abc", "quantity": 1},
+            {"retailer": "ah", "product_id": "bad-2", "name": None, "price_eur": 1.00, "quantity": 1},
+            {"retailer": "ah", "product_id": "sv-1", "name": "Melk", "price_eur": 2.00, "quantity": 2},
+        ]
+        searched = []
+        
+        def search_fn(**kwargs):
+            searched.append(kwargs["query"])
+            return {"results": [
+                {"id": "jumbo:sv-2", "name": "Melk", "retailer": "jumbo", "price": 1.50, "health_tag": "neutral"},
+            ]}
+        
+        savings = find_basket_savings(basket, search_fn)
+        
+        assert set(searched) == {"Melk"}
+        assert savings["potential_savings_total"] == 1.0
+        assert [s["current"]["product_id"] for s in savings["suggestions"]] == ["sv-1"]
@@ -269,3 +269,35 @@ class TestSortProducts:
         assert result[0].price == 1.50
         assert result[1].price == 1.99
 
+    
+    def test_sort_health_partition_matches_key_sort(self):
+        """Test that the bucketed health sort orders like a (health priority, price, name) key sort."""
+        priority = {"healthy": 1, "neutral": 2, "unhealthy": 3}
+        
+        tags = ["unhealthy", "healthy", "neutral", "mystery"]
+        products = [
+            ProductPublic.model_construct(
+                id=str(i), name=f"Product {i % 5}", retailer="ah",
+                price=None if i % 6 == 0 else float(i % 4), health_tag=tags[i % 4],
+            )
+            for i in range(40)
+        ]
+        
+        result = sort_products(products, "health")
+        expected = sorted(
+            products,
+            key=lambda p: (priority.get(p.health_tag, 2), p.price if p.price is not None else 9999, p.name_key),
+        )
+        
+        assert [p.id for p in result] == [p.id for p in expected]
+        assert result[0].health_tag == "healthy"
+        assert result[-1].health_tag == "unhealthy"
+
+
+def test_name_key_is_cached_and_not_serialized():
+    """Test that ProductPublic.name_key is normalized once and never leaks into dumps."""
+    product = ProductPublic(id="1", name=" Halfvolle MELK ", retailer="ah", price=1.0, health_tag="neutral")
+    
+    assert product.name_key == "halfvolle melk"
+    assert product.name_key is product.name_key
+    assert "name_key" not in product.model_dump(mode="json")
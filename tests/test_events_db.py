@@ -137,3 +137,24 @@ def test_db_log_event_with_real_db():
     events = db_get_recent_events(limit=10)
     assert isinstance(events, list)  # Should return a list, even if empty
 
+
+
+@pytest.mark.skipif(
+    os.getenv("DATABASE_URL") is None,
+    reason="DATABASE_URL not set - skipping integration test"
+)
+def test_db_get_event_counts_with_real_db():
+    """Integration test: verify event counts are grouped by event type in the database."""
+    from aggregator.db import db_is_enabled, db_log_event, db_get_event_counts
+    
+    if not db_is_enabled():
+        pytest.skip("Database not enabled - skipping integration test")
+    
+    before = db_get_event_counts(since_hours=1)
+    for event_type in ("test_count_a", "test_count_a", "test_count_b"):
+        db_log_event(event_type=event_type, session_id="test_session_counts", payload={})
+    after = db_get_event_counts(since_hours=1)
+    
+    assert after.get("test_count_a", 0) - before.get("test_count_a", 0) == 2
+    assert after.get("test_count_b", 0) - before.get("test_count_b", 0) == 1
+    assert all(isinstance(count, int) for count in after.values())
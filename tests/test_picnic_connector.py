@@ -182,6 +182,21 @@ class TestPicnicConnectorSearch:
                 results = connector.search_products("test")
                 
                 assert results == []
+    
+    def test_get_delivery_slots_always_returns_list(self, mock_picnic_client):
+        """Test that delivery slots are passed through as a list and other shapes become []."""
+        with patch.dict(os.environ, {
+            "PICNIC_USERNAME": "test@example.com",
+            "PICNIC_PASSWORD": "testpass"
+        }, clear=True):
+            with patch('aggregator.connectors.picnic_connector.PicnicAPI', return_value=mock_picnic_client):
+                connector = PicnicConnector()
+                
+                mock_picnic_client.get_delivery_slots.return_value = [{"slot_id": "a"}]
+                assert connector.get_delivery_slots() == [{"slot_id": "a"}]
+                
+                mock_picnic_client.get_delivery_slots.return_value = {"delivery_slots": []}
+                assert connector.get_delivery_slots() == []
 
 
 class TestPicnicConnectorIntegration:
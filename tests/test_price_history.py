@@ -0,0 +1,63 @@
+"""
+Tests for the demo price history store.
+
+This module tests that get_price_history reads points recorded by
+record_prices_for_products, including lines appended after a previous read.
+"""
+
+import pytest
+
+from aggregator import price_history
+from aggregator.price_history import get_price_history, record_prices_for_products
+
+
+@pytest.fixture
+def history_file(tmp_path, monkeypatch):
+    """Point the price history store at an empty temporary file."""
+    path = tmp_path / "price_history.jsonl"
+    monkeypatch.setattr(price_history, "PRICE_HISTORY_FILE", path)
+    return path
+
+
+def test_get_price_history_sees_appended_points(history_file):
+    """Test that points recorded after a read show up on the next read."""
+    assert get_price_history("123", "ah") == []
+    
+    record_prices_for_products([{"id": "ah:123", "retailer": "ah", "price_eur": 1.99}])
+    assert [p.price_eur for p in get_price_history("123", "ah")] == [1.99]
+    
+    record_prices_for_products([
+        {"id": "ah:123", "retailer": "ah", "price_eur": 1.79},
+        {"id": "jumbo:123", "retailer": "jumbo", "price_eur": 2.49},
+    ])
+    assert [p.price_eur for p in get_price_history("ah:123", "ah")] == [1.99, 1.79]
+    assert [p.price_eur for p in get_price_history("123", "jumbo")] == [2.49]
+    assert len(get_price_history("123", "ah", limit=1)) == 1
+
+
+def test_get_price_history_handles_partial_and_replaced_files(history_file):
+    """Test that incomplete lines wait for their newline and a rewritten file is re-read."""
+    history_file.write_text('{"ts": 1, "product_id": "1", "retailer": "ah", "price_eur": 1.0}\n'
+                            'not json\n'
+                            '{"ts": 2, "product_id": "1", "retailer": "ah", "price_eur": 2.0}')
+    assert [p.ts for p in get_price_history("1", "ah")] == [1.0]
+    
+    with history_file.open("a") as f:
+        f.write("\n")
+    assert [p.ts for p in get_price_history("1", "ah")] == [1.0, 2.0]
+    
+    history_file.write_text('{"ts": 3, "product_id": "1", "retailer": "ah", "price_eur": 3.0}\n')
+    assert [p.ts for p in get_price_history("1", "ah")] == [3.0]
+    
+    history_file.unlink()
+    assert get_price_history("1", "ah") == []
+
+
+def test_get_price_history_keeps_only_recent_points(history_file, monkeypatch):
+    """Test that the index keeps the last MAX_POINTS_PER_PRODUCT points per product."""
+    monkeypatch.setattr(price_history, "MAX_POINTS_PER_PRODUCT", 3)
+    history_file.write_text("".join(
+        f'{{"ts": {ts}, "product_id": "1", "retailer": "ah", "price_eur": 1.0}}\n' for ts in range(1, 6)
+    ))
+    
+    assert [p.ts for p in get_price_history("1", "ah")] == [3.0, 4.0, 5.0]
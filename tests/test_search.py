@@ -755,3 +755,521 @@ class TestAggregatedSearch:
         assert results[1]["price_eur"] == 3.00  # More expensive healthy product second
 
 
+    
+    @patch("aggregator.search.AHConnector")
+    def test_aggregated_search_reuses_connector_instance(self, mock_ah):
+        """Test that the connector is instantiated once and reused across searches."""
+        from aggregator.utils.cache import clear_cache
+        clear_cache()
+        
+        mock_ah.return_value.search_products.return_value = [
+            {"retailer": "ah", "id": "1", "name": "Melk", "price_eur": 1.00, "raw": {}},
+        ]
+        
+        aggregated_search(query="reuse-a", retailers=["ah"], size_per_retailer=10, page=0)
+        aggregated_search(query="reuse-b", retailers=["ah"], size_per_retailer=10, page=0)
+        
+        assert mock_ah.call_count == 1
+        assert mock_ah.return_value.search_products.call_count == 2
+    
+    @patch("aggregator.search.AHConnector")
+    @patch("aggregator.search.JumboConnector")
+    def test_aggregated_search_marks_zero_price_as_cheapest_in_group(self, mock_jumbo, mock_ah):
+        """Test that a price of 0.0 is treated as a real price, not as missing."""
+        from aggregator.utils.cache import clear_cache
+        clear_cache()
+        
+        mock_ah.return_value.search_products.return_value = [
+            {"retailer": "ah", "id": "1", "name": "Proefzakje", "price_eur": 0.0, "raw": {}},
+        ]
+        mock_jumbo.return_value.search_products.return_value = [
+            {"retailer": "jumbo", "id": "2", "name": "Proefzakje", "price_eur": 0.50, "raw": {}},
+        ]
+        
+        response = aggregated_search(query="proefzakje", retailers=["ah", "jumbo"], size_per_retailer=10, page=0)
+        
+        cheapest = [r for r in response["results"] if r["is_cheapest"] is True]
+        assert len(cheapest) == 1
+        assert cheapest[0]["retailer"] == "ah"
+    
+    @patch("aggregator.search.AHConnector")
+    def test_aggregated_search_short_circuits_empty_requests(self, mock_ah):
+        """Test that no connector is touched when there is nothing to search."""
+        assert aggregated_search(query="melk", retailers=[]) == {"results": [], "connectors_status": {}}
+        
+        response = aggregated_search(query="melk", retailers=["ah"], size_per_retailer=0)
+        assert response == {"results": [], "connectors_status": {"ah": "skipped"}}
+        mock_ah.assert_not_called()
+    
+    @patch("aggregator.search.AHConnector")
+    @patch("aggregator.search.JumboConnector")
+    def test_aggregated_search_queries_retailers_concurrently(self, mock_jumbo, mock_ah):
+        """Test that connectors are searched in parallel and results keep request order."""
+        import threading
+        from aggregator.utils.cache import clear_cache
+        clear_cache()
+        
+        # Each connector blocks until the other one is also searching; a sequential
+        # implementation would time out here and report both connectors as errors
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def search_ah(query, size, page):
+            barrier.wait()
+            return [{"retailer": "ah", "id": "1", "name": "Kaas", "price_eur": 3.00, "raw": {}}]
+        
+        def search_jumbo(query, size, page):
+            barrier.wait()
+            return [{"retailer": "jumbo", "id": "2", "name": "Brood", "price_eur": 2.00, "raw": {}}]
+        
+        mock_ah.return_value.search_products.side_effect = search_ah
+        mock_jumbo.return_value.search_products.side_effect = search_jumbo
+        
+        response = aggregated_search(query="parallel", retailers=["ah", "jumbo"], size_per_retailer=10, page=0)
+        
+        assert response["connectors_status"] == {"ah": "ok", "jumbo": "ok"}
+        assert [r["retailer"] for r in response["results"]] == ["ah", "jumbo"]
+    
+    @patch("aggregator.search.AHConnector")
+    def test_aggregated_search_async_matches_sync(self, mock_ah):
+        """Test that the async entry point returns the same response as aggregated_search."""
+        import asyncio
+        from aggregator.search import aggregated_search_async
+        from aggregator.utils.cache import clear_cache
+        clear_cache()
+        
+        mock_ah.return_value.search_products.return_value = [
+            {"retailer": "ah", "id": "1", "name": "Yoghurt", "price_eur": 1.25, "raw": {}},
+        ]
+        
+        response = asyncio.run(aggregated_search_async("yoghurt", ["ah"], size_per_retailer=10))
+        
+        assert response["connectors_status"] == {"ah": "ok"}
+        assert response["results"][0]["id"] == "ah:1"
+        # Second call is served from the cache populated by the first one
+        assert asyncio.run(aggregated_search_async("yoghurt", ["ah"], size_per_retailer=10)) is response
+
+
+def test_search_cache_evicts_least_recently_used(monkeypatch):
+    """Test that the search cache stays bounded and evicts the least recently used key."""
+    from aggregator.utils import cache
+    
+    cache.clear_cache()
+    monkeypatch.setattr(cache, "SEARCH_CACHE_MAX_SIZE", 2)
+    
+    cache.set_cached_search("a", {"results": []})
+    cache.set_cached_search("b", {"results": []})
+    assert cache.get_cached_search("a") is not None  # "b" becomes least recently used
+    cache.set_cached_search("c", {"results": []})
+    
+    assert cache.get_cache_size() == 2
+    assert cache.get_cached_search("b") is None
+    assert cache.get_cached_search("a") is not None
+    cache.clear_cache()
+
+
+@patch("aggregator.search.AHConnector")
+def test_concurrent_identical_searches_share_one_fetch(mock_ah):
+    """Test that identical searches arriving together trigger a single upstream fetch."""
+    import threading
+    import time
+    from aggregator.search import reset_connector
+    from aggregator.utils.cache import clear_cache
+    clear_cache()
+    reset_connector()
+    
+    started = threading.Event()
+    release = threading.Event()
+    
+    def slow_search(query, size=10, page=0):
+        started.set()
+        release.wait(timeout=5)
+        return [{"retailer": "ah", "id": "1", "name": "Melk", "price_eur": 1.09, "raw": {}}]
+    
+    mock_ah.return_value.search_products.side_effect = slow_search
+    
+    responses = []
+    threads = [
+        threading.Thread(target=lambda: responses.append(aggregated_search("melk", ["ah"], size_per_retailer=5)))
+        for _ in range(4)
+    ]
+    threads[0].start()
+    assert started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.1)  # let the followers reach the in-flight wait
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    
+    assert mock_ah.return_value.search_products.call_count == 1
+    assert len(responses) == 4
+    assert all(response is responses[0] for response in responses)
+    reset_connector()
+
+
+@patch("aggregator.search.AHConnector")
+def test_single_retailer_search_runs_inline(mock_ah):
+    """Test that a single-retailer search runs on the calling thread and still groups by name."""
+    import threading
+    from aggregator.search import reset_connector
+    from aggregator.utils.cache import clear_cache
+    clear_cache()
+    reset_connector()
+    
+    calling_thread = threading.current_thread()
+    search_threads = []
+    
+    def search(query, size=10, page=0):
+        search_threads.append(threading.current_thread())
+        return [
+            {"retailer": "ah", "id": "1", "name": "Melk", "price_eur": 1.29, "raw": {}},
+            {"retailer": "ah", "id": "2", "name": "Melk", "price_eur": 0.99, "raw": {}},
+            {"retailer": "ah", "id": "3", "name": "Karnemelk", "price_eur": 1.49, "raw": {}},
+        ]
+    
+    mock_ah.return_value.search_products.side_effect = search
+    
+    response = aggregated_search("melk", ["ah"], size_per_retailer=10, sort_by="price")
+    
+    assert search_threads == [calling_thread]
+    cheapest = {r["id"]: r["is_cheapest"] for r in response["results"]}
+    assert cheapest == {"ah:1": False, "ah:2": True, "ah:3": True}
+    reset_connector()
+
+
+def test_search_cache_uses_redis_when_configured(monkeypatch):
+    """Test that the search cache round-trips through Redis when REDIS_URL is configured."""
+    from aggregator.utils import cache
+    
+    class FakeRedis:
+        def __init__(self):
+            self.store = {}
+        
+        def get(self, key):
+            return self.store.get(key)
+        
+        def set(self, key, value, ex=None):
+            self.store[key] = value
+    
+    fake = FakeRedis()
+    cache.clear_cache()
+    monkeypatch.setattr(cache, "REDIS_ENABLED", True)
+    monkeypatch.setattr(cache, "_redis_client", fake)
+    
+    key = cache.make_search_cache_key("melk", ["jumbo", "ah"], 10, 0, None, None)
+    value = {"results": [{"id": "ah:1", "price": 1.09}], "connectors_status": {"ah": "ok"}}
+    cache.set_cached_search(key, value)
+    
+    assert len(fake.store) == 1
+    assert next(iter(fake.store)).startswith(cache.REDIS_KEY_PREFIX)
+    assert cache.get_cache_size() == 0
+    assert cache.get_cached_search(key) == value
+    assert cache.get_cached_search(cache.make_search_cache_key("brood", ["ah"], 10, 0, None, None)) is None
+
+
+
+def test_search_cache_skips_redis_during_cooldown_after_failure(monkeypatch):
+    """Test that a failing Redis is not retried on every call and the in-memory cache is used instead."""
+    from aggregator.utils import cache
+    
+    class DeadRedis:
+        def __init__(self):
+            self.calls = 0
+        
+        def get(self, key):
+            self.calls += 1
+            raise ConnectionError("Redis down")
+        
+        def set(self, key, value, ex=None):
+            self.calls += 1
+            raise ConnectionError("Redis down")
+    
+    dead = DeadRedis()
+    cache.clear_cache()
+    monkeypatch.setattr(cache, "REDIS_ENABLED", True)
+    monkeypatch.setattr(cache, "_redis_client", dead)
+    monkeypatch.setattr(cache, "_redis_retry_at", 0.0)
+    
+    key = cache.make_search_cache_key("melk", ["ah"], 10, 0, None, None)
+    value = {"results": [], "connectors_status": {"ah": "ok"}}
+    assert cache.get_cached_search(key) is None
+    cache.set_cached_search(key, value)
+    
+    assert dead.calls == 1
+    assert not cache.redis_cache_active()
+    assert cache.get_cached_search(key) == value
+    
+    # Once the cooldown has passed, Redis is tried again
+    monkeypatch.setattr(cache, "_redis_retry_at", 0.0)
+    assert cache.redis_cache_active()
+    cache.clear_cache()
+
+
+@patch("aggregator.search.AHConnector")
+def test_aggregated_search_async_reads_redis_only_in_worker_thread(mock_ah, monkeypatch):
+    """Test that with Redis enabled the async search does one cache read, off the event loop."""
+    import asyncio
+    import threading
+    from aggregator.search import aggregated_search_async
+    from aggregator.utils import cache
+    
+    class FakeRedis:
+        def __init__(self):
+            self.store = {}
+            self.get_threads = []
+        
+        def get(self, key):
+            self.get_threads.append(threading.current_thread())
+            return self.store.get(key)
+        
+        def set(self, key, value, ex=None):
+            self.store[key] = value
+    
+    fake = FakeRedis()
+    cache.clear_cache()
+    monkeypatch.setattr(cache, "REDIS_ENABLED", True)
+    monkeypatch.setattr(cache, "_redis_client", fake)
+    monkeypatch.setattr(cache, "_redis_retry_at", 0.0)
+    mock_ah.return_value.search_products.return_value = [
+        {"retailer": "ah", "id": "1", "name": "Yoghurt", "price_eur": 1.25, "raw": {}},
+    ]
+    
+    response = asyncio.run(aggregated_search_async("yoghurt", ["ah"], size_per_retailer=10))
+    
+    assert response["results"][0]["id"] == "ah:1"
+    assert len(fake.get_threads) == 1
+    assert fake.get_threads[0] is not threading.main_thread()
+    assert len(fake.store) == 1
+
+
+
+@patch("aggregator.search.AHConnector")
+def test_get_connector_remembered_failure_raises_fresh_copies(mock_ah):
+    """Test that a remembered init failure is re-raised without growing a shared traceback."""
+    import traceback
+    from aggregator.connectors.picnic_connector import PicnicAuthError
+    from aggregator.search import get_connector, reset_connector
+    reset_connector()
+    mock_ah.side_effect = PicnicAuthError("bad credentials")
+    
+    raised = []
+    for _ in range(4):
+        with pytest.raises(PicnicAuthError, match="bad credentials") as exc_info:
+            get_connector("ah")
+        raised.append(exc_info.value)
+    reset_connector()
+    
+    assert mock_ah.call_count == 1
+    depths = [len(traceback.extract_tb(error.__traceback__)) for error in raised[1:]]
+    assert depths == [depths[0]] * 3
+    assert len({id(error) for error in raised}) == 4
+
+
+@patch("aggregator.search.PicnicConnector")
+def test_delivery_slots_reuse_shared_connector(mock_picnic):
+    """Test that /delivery/slots reuses the connector instance shared with search."""
+    from fastapi.testclient import TestClient
+    from aggregator.search import reset_connector
+    from api.main import app
+    reset_connector()
+    
+    mock_picnic.return_value.get_delivery_slots.return_value = [{"slot_id": "a"}]
+    client = TestClient(app)
+    
+    first = client.get("/delivery/slots?retailer=picnic")
+    second = client.get("/delivery/slots?retailer=picnic")
+    
+    assert first.status_code == second.status_code == 200
+    assert second.json() == [{"slot_id": "a"}]
+    assert mock_picnic.call_count == 1
+    assert client.get("/delivery/slots?retailer=dirk").json() == []
+    reset_connector()
+
+
+def test_search_endpoint_normalizes_retailer_list():
+    """Test that /search lower-cases, trims and de-duplicates retailers, keeping their order."""
+    from fastapi.testclient import TestClient
+    from api.main import app
+    
+    with patch("api.main.aggregated_search_async", return_value={"results": [], "connectors_status": {}}) as mock_search:
+        response = TestClient(app).get("/search?q=melk&retailers= Jumbo,ah,,JUMBO ")
+    
+    assert response.status_code == 200
+    assert mock_search.call_args.args[1] == ["jumbo", "ah"]
+
+
+def test_search_endpoint_caches_retailer_parsing():
+    """Test that repeated retailers values are parsed once and invalid ones still return 400."""
+    from fastapi.testclient import TestClient
+    from api.main import app, _parse_retailers
+    
+    _parse_retailers.cache_clear()
+    client = TestClient(app)
+    with patch("api.main.aggregated_search_async", return_value={"results": [], "connectors_status": {}}) as mock_search:
+        for _ in range(3):
+            assert client.get("/search?q=melk&retailers=ah,jumbo").status_code == 200
+        invalid = client.get("/search?q=melk&retailers=ah,lidl")
+    
+    assert _parse_retailers.cache_info().hits == 2
+    assert mock_search.call_args.args[1] == ["ah", "jumbo"]
+    assert invalid.status_code == 400
+    assert "lidl" in invalid.json()["detail"]
+
+
+def test_search_endpoint_gzips_large_responses():
+    """Test that /search responses above the minimum size are gzip-compressed."""
+    from fastapi.testclient import TestClient
+    from api.main import app
+    
+    results = [
+        {"id": f"ah:{i}", "name": f"Halfvolle melk {i}", "retailer": "ah", "price_eur": 1.19, "health_tag": "neutral",
+         "image_url": f"https://static.ah.nl/dam/product/{i}.jpg"}
+        for i in range(20)
+    ]
+    with patch("api.main.aggregated_search_async", return_value={"results": results, "connectors_status": {}}):
+        client = TestClient(app)
+        compressed = client.get("/search?q=melk&retailers=ah", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/search?q=melk&retailers=ah", headers={"Accept-Encoding": "identity"})
+    
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in plain.headers
+    assert compressed.json() == plain.json()
+
+
+def test_search_endpoint_validates_and_normalizes_params():
+    """Test that /search rejects bad parameters and passes normalized ones on."""
+    from fastapi.testclient import TestClient
+    from api.main import app
+    
+    client = TestClient(app)
+    with patch("api.main.aggregated_search_async", return_value={"results": [], "connectors_status": {}}) as mock_search:
+        assert client.get("/search?q=melk&retailers=ah&sort_by=cheapest").status_code == 400
+        assert client.get("/search?q=melk&retailers=ah&health_filter=tasty").status_code == 400
+        assert client.get("/search?q=melk&retailers=,").status_code == 400
+        mock_search.assert_not_called()
+        
+        response = client.get("/search?q=melk&retailers=ah&sort_by=Price_DESC&health_filter=Healthy")
+    
+    assert response.status_code == 200
+    assert mock_search.call_args.kwargs["sort_by"] == "price_desc"
+    assert mock_search.call_args.kwargs["health_filter"] == "healthy"
+
+
+def test_root_endpoint_answers_matching_etag_with_304():
+    """Test that / sends an ETag and returns an empty 304 when If-None-Match matches it."""
+    from fastapi.testclient import TestClient
+    from api.main import app
+    
+    client = TestClient(app)
+    first = client.get("/")
+    etag = first.headers["etag"]
+    
+    assert first.status_code == 200
+    assert first.json()["docs"] == "/docs"
+    
+    revalidated = client.get("/", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+    
+    assert client.get("/", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_admin_cache_clear_endpoint(monkeypatch):
+    """Test that POST /admin/cache/clear empties the search cache only for the admin token."""
+    from fastapi.testclient import TestClient
+    from aggregator.utils import cache
+    from api.main import app
+    
+    client = TestClient(app)
+    cache.clear_cache()
+    cache.set_cached_search(cache.make_search_cache_key("melk", ["ah"], 10, 0, None, None), {"results": []})
+    
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert client.post("/admin/cache/clear", headers={"X-Admin-Token": "anything"}).status_code == 404
+    
+    monkeypatch.setenv("ADMIN_TOKEN", "s3cret")
+    assert client.post("/admin/cache/clear").status_code == 403
+    assert client.post("/admin/cache/clear", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert cache.get_cache_size() == 1
+    
+    response = client.post("/admin/cache/clear", headers={"X-Admin-Token": "s3cret"})
+    
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "cleared": 1}
+    assert cache.get_cache_size() == 0
+
+
+def test_clear_cache_unlinks_redis_keys_in_batches(monkeypatch):
+    """Test that clear_cache removes Redis keys in UNLINK batches and counts them."""
+    from aggregator.utils import cache
+    
+    class FakeRedis:
+        def __init__(self, keys):
+            self.keys = keys
+            self.unlink_calls = []
+        
+        def scan_iter(self, match=None, count=None):
+            return iter(list(self.keys))
+        
+        def unlink(self, *keys):
+            self.unlink_calls.append(keys)
+            return len(keys)
+    
+    fake = FakeRedis([f"{cache.REDIS_KEY_PREFIX}{i}" for i in range(5)])
+    monkeypatch.setattr(cache, "REDIS_ENABLED", True)
+    monkeypatch.setattr(cache, "_redis_client", fake)
+    monkeypatch.setattr(cache, "REDIS_CLEAR_BATCH_SIZE", 2)
+    
+    assert cache.clear_cache() == 5
+    assert [len(call) for call in fake.unlink_calls] == [2, 2, 1]
+
+
+@patch("aggregator.search.AHConnector")
+@patch("aggregator.search.JumboConnector")
+def test_search_stream_endpoint_yields_one_line_per_retailer(mock_jumbo, mock_ah):
+    """Test that /search/stream emits an NDJSON line per retailer with sorted, filtered results."""
+    import json
+    from fastapi.testclient import TestClient
+    from aggregator.search import reset_connector
+    from aggregator.utils.cache import clear_cache
+    from api.main import app
+    from api.schemas import ProductBase
+    reset_connector()
+    clear_cache()
+    
+    mock_ah.return_value.search_products.return_value = [
+        {"id": "ah-2", "name": "Melk", "price": 1.49, "retailer": "ah", "brand": "AH"},
+        {"id": "ah-1", "name": "Melk", "price": 0.99, "retailer": "ah", "brand": "AH"},
+    ]
+    mock_jumbo.return_value.search_products.side_effect = RuntimeError("Jumbo down")
+    client = TestClient(app)
+    url = "/search/stream?q=melk&retailers=ah,jumbo&sort_by=price_asc"
+    
+    with patch("api.main.log_search_performed") as mock_log:
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    batches = {batch["retailer"]: batch for batch in map(json.loads, response.text.splitlines())}
+    assert set(batches) == {"ah", "jumbo"}
+    assert [p["id"] for p in batches["ah"]["results"]] == ["ah:ah-1", "ah:ah-2"]
+    # Same public product format as /search: internal fields are not streamed
+    assert all(set(p) == set(ProductBase.model_fields) for p in batches["ah"]["results"])
+    assert batches["jumbo"]["status"] != "ok"
+    assert batches["jumbo"]["results"] == []
+    mock_log.assert_called_once()
+    assert mock_log.call_args.kwargs["result_count"] == 2
+    
+    # The completed stream filled the shared cache: /search and a second stream skip the retailers
+    search_response = client.get("/search?q=melk&retailers=ah,jumbo&sort_by=price_asc")
+    replayed = [json.loads(line) for line in client.get(url).text.splitlines()]
+    reset_connector()
+    clear_cache()
+    
+    assert mock_ah.return_value.search_products.call_count == 1
+    assert [p["id"] for p in search_response.json()["results"]] == ["ah:ah-1", "ah:ah-2"]
+    assert [batch["retailer"] for batch in replayed] == ["ah", "jumbo"]
+    assert [p["id"] for p in replayed[0]["results"]] == ["ah:ah-1", "ah:ah-2"]
+    assert replayed[0]["results"][0]["is_cheapest"] is True
@@ -100,6 +100,22 @@ class TestParseQuantityAndUnit:
         assert qty == 1250.0
         assert unit == "mL"
     
+    def test_parse_with_leading_text(self):
+        """Test parsing sizes that do not start with a digit."""
+        qty, unit = parse_quantity_and_unit("ca. 500 g")
+        assert qty == 500.0
+        assert unit == "g"
+        
+        qty, unit = parse_quantity_and_unit("Pak 2 x 330 ml")
+        assert qty == 660.0
+        assert unit == "mL"
+    
+    def test_parse_multi_pack_after_leading_quantity(self):
+        """Test that a multi-pack size later in the string wins over a leading simple quantity."""
+        assert parse_quantity_and_unit("1 doos 10 x 20 g") == (200.0, "g")
+        assert parse_quantity_and_unit("1 pak 6 x 200 ml") == (1200.0, "mL")
+        assert parse_quantity_and_unit("Per 4 stuks, 4 x 125 g") == (500.0, "g")
+    
     def test_parse_invalid_formats(self):
         """Test parsing invalid or unparseable formats."""
         qty, unit = parse_quantity_and_unit("")